@@ -38,7 +38,11 @@ class MsgSerializer:
     def decode_custom_classes(obj):
         if "__ModalityConfig_class__" in obj:
             obj = ModalityConfig(**json.loads(obj["as_json"]))
-        if "__ndarray_class__" in obj:
+        if "__nd__" in obj:
+            # Read-only view of the received bytes, no NPY header to parse
+            obj = np.frombuffer(obj["b"], dtype=np.dtype(obj["t"])).reshape(obj["s"])
+        elif "__ndarray_class__" in obj:
+            # Peers still sending NPY payloads
             obj = np.load(io.BytesIO(obj["as_npy"]), allow_pickle=False)
         return obj
 
@@ -47,9 +51,10 @@ class MsgSerializer:
         if isinstance(obj, ModalityConfig):
             return {"__ModalityConfig_class__": True, "as_json": obj.model_dump_json()}
         if isinstance(obj, np.ndarray):
-            output = io.BytesIO()
-            np.save(output, obj, allow_pickle=False)
-            return {"__ndarray_class__": True, "as_npy": output.getvalue()}
+            if obj.dtype.hasobject:
+                raise ValueError("Object arrays cannot be serialized")
+            # Raw C-order bytes plus shape and dtype: a single copy instead of an NPY file
+            return {"__nd__": True, "s": obj.shape, "t": obj.dtype.str, "b": obj.tobytes()}
         return obj
 
 
@@ -65,10 +70,13 @@ class BaseInferenceServer:
     Can add custom endpoints by calling `register_endpoint`.
     """
 
+    # Subclasses that route replies themselves (e.g. to batch requests) can use zmq.ROUTER
+    socket_type: int = zmq.REP
+
     def __init__(self, host: str = "*", port: int = 5555, api_token: str = None):
         self.running = True
         self.context = zmq.Context()
-        self.socket = self.context.socket(zmq.REP)
+        self.socket = self.context.socket(self.socket_type)
         self.socket.bind(f"tcp://{host}:{port}")
         self._endpoints: dict[str, EndpointHandler] = {}
         self.api_token = api_token
@@ -261,8 +261,10 @@ class Gr00tPolicy(BasePolicy):
             # Create new action head with updated config
             new_action_head = FlowmatchingActionHead(new_action_head_config)
 
-            # Copy the weights from the old action head to the new one
+            # Copy the weights from the old action head to the new one, keeping the loaded
+            # COMPUTE_DTYPE weights rather than the default fp32 the new head was built in
             new_action_head.load_state_dict(model.action_head.state_dict(), strict=False)
+            new_action_head.to(dtype=model.action_head.dtype)
 
             # Replace the action head
             model.action_head = new_action_head
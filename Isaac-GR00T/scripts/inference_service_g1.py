@@ -8,6 +8,8 @@ The HTTP server exposes a REST API for easy integration with web applications an
 
 1. Default is zmq server.
 
+The ZMQ server runs on asyncio, using uvloop as the event loop when it is installed (`pip install uvloop`).
+
 Run server: python scripts/inference_service.py --server
 Run client: python scripts/inference_service.py --client
 
@@ -27,22 +29,37 @@ You can use bore to forward the port to your client: `159.223.171.199` is bore.p
     bore local 8000 --to 159.223.171.199
 """
 
+import asyncio
+import base64
+import functools
+import struct
 import time
-import json
+import traceback
 from dataclasses import dataclass
 from typing import Literal
 from pathlib import Path
 from datetime import datetime
 import threading
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+from queue import Full, Queue
 
 import numpy as np
+import orjson
+import torch
 import tyro
+import zmq
+import zmq.asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from gr00t.data.embodiment_tags import EMBODIMENT_TAG_MAPPING
 from gr00t.eval.robot import RobotInferenceClient, RobotInferenceServer
+from gr00t.eval.service import MsgSerializer
 from gr00t.experiment.data_config import load_data_config
-from gr00t.model.policy import Gr00tPolicy
+from gr00t.model.policy import Gr00tPolicy, squeeze_dict_values, unsqueeze_dict_values
 
 
 @dataclass
@@ -87,111 +104,500 @@ class ArgsConfig:
     log_dir: str = "logs/groot_server"
     """Directory to save input/output logs."""
 
+    max_batch: int = 8
+    """Maximum number of queued get_action requests to run as one batch (ZMQ server only)."""
+
+    batch_wait_ms: float = 0.0
+    """How long to wait for more requests to fill a batch. 0 batches only what is already queued."""
+
+    compile: bool = True
+    """Whether to torch.compile the diffusion transformer and warm it up (for every batch size up to max_batch) before serving."""
+
+    num_requests: int = 1
+    """Number of requests the client sends with the same observation."""
+
+    log_every: int = 1
+    """Only log summaries, arrays and images for every Nth step (inference time is still printed every step)."""
+
 
 #####################################################################################
 
 
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+# Inlined arrays larger than this are base64-packed instead of written as JSON lists
+_INLINE_LIST_MAX_BYTES = 4096
+
+
+def _pack(value: np.ndarray) -> dict:
+    """Pack an array as base64 of its raw bytes plus the shape/dtype needed to restore it."""
+    return {
+        "shape": list(value.shape),
+        "dtype": str(value.dtype),
+        "b64": base64.b64encode(np.ascontiguousarray(value)).decode("ascii"),
+    }
+
+
+def _array_stats(value: np.ndarray) -> tuple[float, float, float]:
+    """Return (min, max, mean) of an array.
+
+    min/max are cheap SIMD reductions; np.mean on a uint8 frame is not, since it widens every
+    element to float64. For uint8 the sum is instead accumulated over 256-row blocks in uint16
+    lanes (256 * 255 fits in uint16), which is exact and several times faster.
+    """
+    flat = value.reshape(-1)
+    if flat.dtype != np.uint8 or flat.size < 256:
+        return float(flat.min()), float(flat.max()), float(flat.mean())
+    n = flat.size - flat.size % 256
+    total = int(flat[:n].reshape(256, -1).sum(axis=0, dtype=np.uint16).sum(dtype=np.uint64))
+    total += int(flat[n:].sum(dtype=np.uint64))
+    return float(flat.min()), float(flat.max()), total / flat.size
+
+
+def _array_log_entry(key: str, value: np.ndarray) -> dict:
+    """Summarize an array for the server log.
+
+    Non-video arrays are also inlined as `data`: small ones as JSON lists (orjson serializes
+    them straight from the array buffer), large ones packed with `_pack`. Video frames are
+    only available in the .npz sidecar.
+    """
+    vmin, vmax, vmean = _array_stats(value)
+    entry = {
+        "shape": list(value.shape), "dtype": str(value.dtype),
+        "min": vmin, "max": vmax, "mean": vmean,
+    }
+    if "video" not in key.lower():
+        if value.nbytes > _INLINE_LIST_MAX_BYTES:
+            entry["data"] = _pack(value)
+        else:
+            entry["data"] = np.ascontiguousarray(value)
+    return entry
+
+
+# Flat binary get_action messages (the G1 clients' `protocol="flat"`). 0xc1 is never used by msgpack,
+# so a leading 0xc1 tells them apart from msgpack requests and replies.
+#   request: 0xc1 | u32 height | u32 width | uint8 image (H, W, 3) | float64 states (4, 7)
+#            | u16 task description length | utf-8 task description
+#   reply:   0xc1 | u32 n_timesteps | float32 actions (n_timesteps, 28)
+# States and actions are little-endian, in left_arm, right_arm, left_hand, right_hand order.
+_FLAT_MAGIC = b"\xc1"
+_FLAT_STATE_KEYS = ("state.left_arm", "state.right_arm", "state.left_hand", "state.right_hand")
+_FLAT_ACTION_KEYS = ("action.left_arm", "action.right_arm", "action.left_hand", "action.right_hand")
+
+
+def _unpack_flat_observation(buffer) -> dict:
+    """Decode a flat get_action request into the observation dict the policy takes."""
+    if buffer[:1] != _FLAT_MAGIC:
+        raise ValueError("Not a flat get_action request")
+    height, width = struct.unpack_from("<II", buffer, 1)
+    offset = 9
+    image = np.frombuffer(buffer, dtype=np.uint8, count=height * width * 3, offset=offset)
+    offset += image.nbytes
+    states = np.frombuffer(buffer, dtype="<f8", count=4 * 7, offset=offset).reshape(4, 7)
+    offset += states.nbytes
+    (task_length,) = struct.unpack_from("<H", buffer, offset)
+    offset += 2
+    if len(buffer) != offset + task_length:
+        raise ValueError(f"Flat get_action request is {len(buffer)} bytes, expected {offset + task_length}")
+    obs = {"video.rs_view": image.reshape(1, height, width, 3)}
+    for i, key in enumerate(_FLAT_STATE_KEYS):
+        obs[key] = states[i : i + 1]
+    obs["annotation.human.task_description"] = [bytes(buffer[offset : offset + task_length]).decode("utf-8")]
+    return obs
+
+
+def _pack_flat_actions(result: dict) -> bytes:
+    """Encode a get_action result as a flat reply."""
+    actions = np.concatenate([result[key] for key in _FLAT_ACTION_KEYS], axis=-1).astype("<f4", copy=False)
+    return _FLAT_MAGIC + struct.pack("<I", actions.shape[0]) + actions.tobytes()
+
+
 class LoggingRobotInferenceServer(RobotInferenceServer):
-    """Simple server that logs directly in the request loop."""
+    """Server that logs per-step summaries in the request loop.
+
+    Full observation/action arrays and the input image are handed to background threads
+    (written as `arrays/step_NNNNNN.npz` and `images/step_NNNNNN.jpg`), so the request loop
+    never serializes or encodes them.
+
+    Uses a ROUTER socket so several clients can be in flight at once: `get_action` requests
+    that are queued together (up to `max_batch`, optionally waiting `batch_wait_ms` for more)
+    are stacked and run through the policy in a single forward pass.
+    
+    `get_action` requests may also use the flat binary layout (see `_FLAT_MAGIC`) and are
+    answered in the same layout; they carry no API token, so they are refused when one is set.
+    
+    With a `Gr00tPolicy` on the GPU, the transformed `get_action` inputs are copied to the device
+    through persistent pinned buffers on a dedicated CUDA stream (see `_to_device`).
+    """
+    
+    socket_type = zmq.ROUTER
     
-    def __init__(self, model, host: str = "*", port: int = 5555, api_token: str = None, log_dir: str = "logs/groot_server"):
+    def __init__(self, model, host: str = "*", port: int = 5555, api_token: str = None, log_dir: str = "logs/groot_server", flush_every: int = 50, max_batch: int = 8, batch_wait_ms: float = 0.0, log_every: int = 1):
         super().__init__(model, host, port, api_token)
+        # Pinned host buffers keyed by (input key, shape, dtype), allocated on first use
+        self._pinned = {}
+        self._copy_stream = None
+        self._copy_done = None
+        self._policy = None
+        if isinstance(model, Gr00tPolicy) and model.model.device.type == "cuda":
+            self._policy = model
+            self.register_endpoint("get_action", self._get_action_staged)
+        self.max_batch = max_batch
+        self.batch_wait_ms = batch_wait_ms
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         self.image_dir = self.log_dir / "images"
         self.image_dir.mkdir(parents=True, exist_ok=True)
         
+        self.array_dir = self.log_dir / "arrays"
+        self.array_dir.mkdir(parents=True, exist_ok=True)
+        
         timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
         self.log_file = self.log_dir / f"server_log_{timestamp}.jsonl"
         self.step_count = 0
         
+        # One long-lived buffered handle; flushed every `flush_every` logged steps and on close
+        self._log_fp = open(self.log_file, 'ab', buffering=1 << 20)
+        self.flush_every = flush_every
+        self.log_every = log_every
+        self._log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="server-log")
+        self._log_futures = set()  # in flight on the executor
+        
+        # Entries carry `t_ns` (monotonic ns since this point); the start entry anchors it to wall time
+        self._t0_wall = time.time()
+        self._t0_mono = time.monotonic_ns()
+        start_log = {"type": "start", "timestamp": datetime.fromtimestamp(self._t0_wall).isoformat(), "unix_time": self._t0_wall}
+        self._log_fp.write(orjson.dumps(start_log, option=_ORJSON_OPTS))
+        
         print(f"[SERVER LOG] Logging to {self.log_file}")
         print(f"[SERVER LOG] Saving images to {self.image_dir}")
+        print(f"[SERVER LOG] Saving arrays to {self.array_dir}")
+        
+        # Full arrays are persisted off the request thread
+        self._array_queue = Queue()
+        self._array_writer = threading.Thread(target=self._write_arrays, daemon=True)
+        self._array_writer.start()
+        
+        # Images are best-effort: a full queue drops the frame instead of stalling requests
+        self._image_queue = Queue(maxsize=64)
+        self._image_writer = threading.Thread(target=self._write_images, daemon=True)
+        self._image_writer.start()
     
-    def run(self):
-        """Override run to add inline logging."""
-        from gr00t.eval.service import MsgSerializer
-        import zmq
+    def _write_arrays(self):
+        """Drain the array queue and write one compressed .npz sidecar per step."""
+        while True:
+            item = self._array_queue.get()
+            if item is None:
+                break
+            step, arrays = item
+            try:
+                np.savez_compressed(self.array_dir / f"step_{step:06d}.npz", **arrays)
+            except Exception as e:
+                print(f"[SERVER LOG] Failed to write arrays for step {step}: {e}")
+    
+    def _write_images(self):
+        """Drain the image queue and write one JPEG per step."""
+        from PIL import Image
         
+        while True:
+            item = self._image_queue.get()
+            if item is None:
+                break
+            step, img_data = item
+            try:
+                Image.fromarray(img_data.astype(np.uint8)).save(self.image_dir / f"step_{step:06d}.jpg", quality=85)
+            except Exception:
+                np.save(self.image_dir / f"step_{step:06d}.npy", img_data)
+    
+    def close(self):
+        """Flush pending log/array/image writes and stop the writer threads."""
+        self._log_executor.shutdown(wait=True)
+        self._array_queue.put(None)
+        self._image_queue.put(None)
+        self._array_writer.join()
+        self._image_writer.join()
+        self._log_fp.close()
+    
+    def run(self):
+        """Serve requests, running `get_action` requests that arrive together as one batch."""
         addr = self.socket.getsockopt_string(zmq.LAST_ENDPOINT)
         print(f"Server is ready and listening on {addr}")
         
+        if uvloop is not None:
+            uvloop.run(self._serve())
+        else:
+            asyncio.run(self._serve())
+    
+    async def _serve(self):
+        try:
+            await self._serve_requests()
+        finally:
+            # Let queued log records be written (and failures reported) while the loop still runs
+            if self._log_futures:
+                await asyncio.wait(self._log_futures)
+    
+    async def _serve_requests(self):
+        self._async_socket = zmq.asyncio.Socket.from_socket(self.socket)
+        
         while self.running:
-            try:
-                message = self.socket.recv()
-                request = MsgSerializer.from_bytes(message)
-                
-                if not self._validate_token(request):
-                    self.socket.send(MsgSerializer.to_bytes({"error": "Unauthorized: Invalid API token"}))
-                    continue
-                
-                endpoint = request.get("endpoint", "get_action")
-                
-                if endpoint not in self._endpoints:
-                    raise ValueError(f"Unknown endpoint: {endpoint}")
-                
-                # Log and process get_action requests
-                if endpoint == "get_action":
-                    self.step_count += 1
-                    obs = request.get("data", {})
-                    
-                    # Log input
-                    input_log = {"step": self.step_count, "timestamp": datetime.now().isoformat(), "type": "input", "observation": {}}
-                    for key, value in obs.items():
-                        if isinstance(value, np.ndarray):
-                            input_log["observation"][key] = {
-                                "shape": list(value.shape), "dtype": str(value.dtype),
-                                "min": float(np.min(value)), "max": float(np.max(value)),
-                                "mean": float(np.mean(value)), "data": value.tolist()
-                            }
+            # Wait for one request, then drain whatever else arrives within the batch window
+            # copy=False yields zmq.Frames over libzmq's buffers, so the payload isn't copied into bytes
+            messages = [await self._async_socket.recv_multipart(copy=False)]
+            deadline = time.monotonic() + self.batch_wait_ms / 1000
+            while len(messages) < self.max_batch:
+                timeout_ms = max(0.0, deadline - time.monotonic()) * 1000
+                if not await self._async_socket.poll(timeout_ms):
+                    break
+                messages.append(await self._async_socket.recv_multipart(copy=False))
+            
+            pending = []  # (envelope, obs, flat) for get_action
+            for frames in messages:
+                # ROUTER prefixes the client identity (and REQ's empty delimiter); echo it back
+                envelope, message = frames[:-1], frames[-1]
+                try:
+                    if message.buffer[:1] == _FLAT_MAGIC:
+                        if self.api_token is not None:
+                            await self._reply(envelope, {"error": "Unauthorized: flat requests carry no API token"})
                         else:
-                            input_log["observation"][key] = value if isinstance(value, list) else str(value)
+                            pending.append((envelope, _unpack_flat_observation(message.buffer), True))
+                        continue
                     
-                    # Save image
-                    for key, value in obs.items():
-                        if 'video' in key.lower() and isinstance(value, np.ndarray) and value.ndim >= 3:
-                            img_data = value[0] if value.ndim == 4 else value
-                            try:
-                                from PIL import Image
-                                Image.fromarray(img_data.astype(np.uint8)).save(self.image_dir / f"step_{self.step_count:06d}.png")
-                            except:
-                                np.save(self.image_dir / f"step_{self.step_count:06d}.npy", img_data)
-                            break
+                    request = MsgSerializer.from_bytes(message.buffer)
                     
-                    # Get action
-                    handler = self._endpoints[endpoint]
-                    time_start = time.time()
-                    result = handler.handler(obs)
-                    inference_time = time.time() - time_start
+                    if not self._validate_token(request):
+                        await self._reply(envelope, {"error": "Unauthorized: Invalid API token"})
+                        continue
+                    
+                    endpoint = request.get("endpoint", "get_action")
                     
-                    # Log output
-                    output_log = {"step": self.step_count, "timestamp": datetime.now().isoformat(), "type": "output", "inference_time": inference_time, "action": {}}
-                    for key, value in result.items():
-                        if isinstance(value, np.ndarray):
-                            output_log["action"][key] = {
-                                "shape": list(value.shape), "dtype": str(value.dtype),
-                                "min": float(np.min(value)), "max": float(np.max(value)),
-                                "mean": float(np.mean(value)), "data": value.tolist()
-                            }
+                    if endpoint not in self._endpoints:
+                        raise ValueError(f"Unknown endpoint: {endpoint}")
                     
-                    # Write logs
-                    with open(self.log_file, 'a') as f:
-                        f.write(json.dumps(input_log) + '\n')
-                        f.write(json.dumps(output_log) + '\n')
+                    if endpoint == "get_action":
+                        pending.append((envelope, request.get("data", {}), False))
+                        continue
                     
-                    print(f"[SERVER LOG] Step {self.step_count}: Inference {inference_time:.3f}s")
-                else:
                     # Other endpoints
                     handler = self._endpoints[endpoint]
                     result = handler.handler(request.get("data", {})) if handler.requires_input else handler.handler()
-                
-                self.socket.send(MsgSerializer.to_bytes(result))
-            except Exception as e:
-                print(f"Error in server: {e}")
-                import traceback
-                traceback.print_exc()
-                self.socket.send(MsgSerializer.to_bytes({"error": str(e)}))
+                    await self._reply(envelope, result)
+                except Exception as e:
+                    await self._reply_error(envelope, e)
+            
+            for batch in _group_batchable(pending):
+                await self._handle_get_action(batch)
+    
+    async def _reply(self, envelope: list, data: dict, flat: bool = False):
+        payload = _pack_flat_actions(data) if flat else MsgSerializer.to_bytes(data)
+        await self._async_socket.send_multipart([*envelope, payload], copy=False)
+    
+    async def _reply_error(self, envelope: list, e: Exception):
+        print(f"Error in server: {e}")
+        traceback.print_exc()
+        await self._reply(envelope, {"error": str(e)})
+    
+    async def _handle_get_action(self, batch: list):
+        """Run one policy call for `batch` ([(envelope, obs, flat), ...]), reply to each request, then log in the background."""
+        input_t_ns = time.monotonic_ns() - self._t0_mono
+        handler = self._endpoints["get_action"]
+        try:
+            time_start = time.time()
+            if len(batch) == 1:
+                results = [handler.handler(batch[0][1])]
+            else:
+                result = handler.handler(_stack_observations([obs for _, obs, _ in batch]))
+                results = [{key: value[i] for key, value in result.items()} for i in range(len(batch))]
+            inference_time = time.time() - time_start
+            output_t_ns = time.monotonic_ns() - self._t0_mono
+        except Exception as e:
+            for envelope, _, _ in batch:
+                await self._reply_error(envelope, e)
+            return
+        
+        loop = asyncio.get_running_loop()
+        for (envelope, obs, flat), result in zip(batch, results):
+            self.step_count += 1
+            await self._reply(envelope, result, flat)
+            if self.step_count % self.log_every != 0:
+                continue
+            # Logging overlaps with the next request; one worker keeps log lines in step order
+            future = loop.run_in_executor(self._log_executor, self._log_step, self.step_count, input_t_ns, output_t_ns, obs, result, inference_time)
+            future.add_done_callback(functools.partial(self._log_step_done, self.step_count))
+            self._log_futures.add(future)
+            future.add_done_callback(self._log_futures.discard)
+        
+        batch_info = f" (batch of {len(batch)})" if len(batch) > 1 else ""
+        print(f"[SERVER LOG] Step {self.step_count}: Inference {inference_time:.3f}s{batch_info}")
+    
+    @staticmethod
+    def _log_step_done(step: int, future: asyncio.Future):
+        """Report a failed `_log_step`, which would otherwise be dropped with its future."""
+        if not future.cancelled() and future.exception() is not None:
+            e = future.exception()
+            print(f"[SERVER LOG] Failed to log step {step}: {e!r}")
+            traceback.print_exception(type(e), e, e.__traceback__)
+    
+    def _get_action_staged(self, observations: dict) -> dict:
+        """`Gr00tPolicy.get_action`, with the transformed inputs moved to the GPU by `_to_device`."""
+        policy = self._policy
+        obs = observations.copy()
+        is_batch = policy._check_state_is_batched(obs)
+        if not is_batch:
+            obs = unsqueeze_dict_values(obs)
+        for key, value in obs.items():
+            if not isinstance(value, np.ndarray):
+                obs[key] = np.array(value)
+        normalized_input = self._to_device(policy.apply_transforms(obs))
+        action = policy._get_unnormalized_action(policy._get_action_from_normalized_input(normalized_input))
+        return action if is_batch else squeeze_dict_values(action)
+    
+    def _to_device(self, inputs: dict) -> dict:
+        """Copy the host tensors in `inputs` to the policy's GPU on a dedicated stream.
+        
+        Each tensor is staged in a persistent pinned buffer, so the copy is a true async H2D copy
+        without a pinned allocation per request; the compute stream waits on the copy stream.
+        Shapes only change with the batch size, so there are at most a few buffers per key.
+        """
+        device = self._policy.model.device
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream(device)
+            self._copy_done = torch.cuda.Event()
+        # The previous request's copies must have read the pinned buffers before they are rewritten
+        self._copy_done.synchronize()
+        compute_stream = torch.cuda.current_stream(device)
+        outputs = {}
+        with torch.cuda.stream(self._copy_stream):
+            for key, value in inputs.items():
+                if not isinstance(value, torch.Tensor) or value.device.type != "cpu":
+                    outputs[key] = value
+                    continue
+                buffer_key = (key, tuple(value.shape), value.dtype)
+                pinned = self._pinned.get(buffer_key)
+                if pinned is None:
+                    pinned = self._pinned[buffer_key] = torch.empty(value.shape, dtype=value.dtype, pin_memory=True)
+                pinned.copy_(value)
+                outputs[key] = pinned.to(device, non_blocking=True)
+                # Allocated on the copy stream, used on the compute stream
+                outputs[key].record_stream(compute_stream)
+            self._copy_done.record()
+        compute_stream.wait_stream(self._copy_stream)
+        return outputs
+    
+    def _log_step(self, step: int, input_t_ns: int, output_t_ns: int, obs: dict, result: dict, inference_time: float):
+        # Log input (video frames only go to the .npz sidecar)
+        arrays = {}
+        input_log = {"step": step, "t_ns": input_t_ns, "type": "input", "observation": {}}
+        for key, value in obs.items():
+            if isinstance(value, np.ndarray):
+                input_log["observation"][key] = _array_log_entry(key, value)
+                arrays[key] = value
+            else:
+                input_log["observation"][key] = value if isinstance(value, list) else str(value)
+        
+        # Queue image for the writer thread
+        for key, value in obs.items():
+            if 'video' in key.lower() and isinstance(value, np.ndarray) and value.ndim >= 3:
+                img_data = value[0] if value.ndim == 4 else value
+                try:
+                    self._image_queue.put_nowait((step, img_data))
+                except Full:
+                    pass
+                break
+        
+        # Log output
+        output_log = {"step": step, "t_ns": output_t_ns, "type": "output", "inference_time": inference_time, "action": {}}
+        for key, value in result.items():
+            if isinstance(value, np.ndarray):
+                output_log["action"][key] = _array_log_entry(key, value)
+                arrays[key] = value
+        self._array_queue.put((step, arrays))
+        
+        # Write logs
+        self._log_fp.write(
+            orjson.dumps(input_log, option=_ORJSON_OPTS) + orjson.dumps(output_log, option=_ORJSON_OPTS)
+        )
+        if step % (self.flush_every * self.log_every) == 0:
+            self._log_fp.flush()
+
+
+def _batch_key(obs: dict):
+    """Key under which unbatched observations can be stacked together, or None if `obs` is already batched."""
+    key = []
+    for name, value in sorted(obs.items()):
+        if isinstance(value, np.ndarray):
+            if "state" in name and value.ndim >= 3:  # (B, T, D), see Gr00tPolicy._check_state_is_batched
+                return None
+            key.append((name, value.shape, value.dtype.str))
+        elif isinstance(value, list):
+            key.append((name, len(value)))
+        else:
+            return None
+    return tuple(key)
+
+
+def _group_batchable(pending: list) -> list:
+    """Split [(envelope, obs, flat), ...] into batches of observations that can be stacked together."""
+    groups = {}
+    batches = []
+    for entry in pending:
+        key = _batch_key(entry[1])
+        if key is None:
+            batches.append([entry])
+        else:
+            groups.setdefault(key, []).append(entry)
+    return batches + list(groups.values())
+
+
+def _stack_observations(observations: list) -> dict:
+    """Stack unbatched observations into a (B, ...) batch that `Gr00tPolicy.get_action` accepts."""
+    return {
+        key: np.stack([np.asarray(obs[key]) for obs in observations])
+        for key in observations[0]
+    }
+
+
+#####################################################################################
+
+
+def _example_observation(rng: np.random.Generator) -> dict:
+    """Random unbatched observation matching the `unitree_g1` data config."""
+    return {
+        "video.rs_view": rng.integers(0, 256, (1, 480, 640, 3), dtype=np.uint8),
+        "state.left_arm": rng.random((1, 7)),
+        "state.right_arm": rng.random((1, 7)),
+        "state.left_hand": rng.random((1, 7)),
+        "state.right_hand": rng.random((1, 7)),
+        "annotation.human.task_description": ["do your thing!"],
+    }
+
+
+def _compile_policy(policy: Gr00tPolicy, max_batch: int = 1):
+    """Compile the diffusion transformer (run once per denoising step) and warm it up.
+
+    Every batch size from 1 to `max_batch` is warmed up: with static shapes each size gets its
+    own compiled graph and CUDA graph, which would otherwise be built inside a live request.
+    Falls back to eager mode if compilation or the warmup fails, e.g. for a data config
+    whose keys don't match `_example_observation`.
+    """
+    action_head = policy.model.action_head
+    dit = action_head.model
+    action_head.model = torch.compile(dit, mode="reduce-overhead", fullgraph=False, dynamic=False)
+    try:
+        time_start = time.time()
+        obs = _example_observation(np.random.default_rng(0))
+        for batch_size in range(1, max_batch + 1):
+            # Batches are built by the server the same way
+            batch = obs if batch_size == 1 else _stack_observations([obs] * batch_size)
+            for _ in range(2):  # first call compiles, second records the CUDA graph
+                policy.get_action(batch)
+        print(
+            f"[SERVER LOG] Compiled and warmed up policy for batch sizes 1-{max_batch} "
+            f"in {time.time() - time_start:.1f}s"
+        )
+    except Exception as e:
+        print(f"[SERVER LOG] torch.compile warmup failed, serving in eager mode: {e}")
+        action_head.model = dit
 
 
 #####################################################################################
@@ -264,6 +670,9 @@ def main(args: ArgsConfig):
             embodiment_tag=args.embodiment_tag,
             denoising_steps=args.denoising_steps,
         )
+        if args.compile:
+            # Only the ZMQ server batches requests
+            _compile_policy(policy, max_batch=1 if args.http_server else args.max_batch)
 
         # Start the server
         if args.http_server:
@@ -274,8 +683,19 @@ def main(args: ArgsConfig):
             )
             server.run()
         else:
-            server = LoggingRobotInferenceServer(policy, port=args.port, api_token=args.api_token, log_dir=args.log_dir)
-            server.run()
+            server = LoggingRobotInferenceServer(
+                policy,
+                port=args.port,
+                api_token=args.api_token,
+                log_dir=args.log_dir,
+                max_batch=args.max_batch,
+                batch_wait_ms=args.batch_wait_ms,
+                log_every=args.log_every,
+            )
+            try:
+                server.run()
+            finally:
+                server.close()
 
     # Here is mainly a testing code
     elif args.client:
@@ -293,19 +713,14 @@ def main(args: ArgsConfig):
         # - action: action.right_arm: (16, 7)
         # - action: action.left_hand: (16, 7)
         # - action: action.right_hand: (16, 7)
-        obs = {
-            "video.rs_view": np.random.randint(0, 256, (1, 480, 640, 3), dtype=np.uint8),
-            "state.left_arm": np.random.rand(1, 7),
-            "state.right_arm": np.random.rand(1, 7),
-            "state.left_hand": np.random.rand(1, 7),
-            "state.right_hand": np.random.rand(1, 7),
-            "annotation.human.task_description": ["do your thing!"],
-        }
-
-        if args.http_server:
-            action = _example_http_client_call(obs, args.host, args.port, args.api_token)
-        else:
-            action = _example_zmq_client_call(obs, args.host, args.port, args.api_token)
+        # Generated once and reused for every request so the client measures the server, not the RNG
+        obs = _example_observation(np.random.default_rng(0))
+
+        for _ in range(args.num_requests):
+            if args.http_server:
+                action = _example_http_client_call(obs, args.host, args.port, args.api_token)
+            else:
+                action = _example_zmq_client_call(obs, args.host, args.port, args.api_token)
 
         for key, value in action.items():
             print(f"Action: {key}: {value.shape}")
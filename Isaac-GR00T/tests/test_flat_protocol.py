@@ -0,0 +1,94 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SERVER_PATH = REPO_ROOT / "Isaac-GR00T" / "scripts" / "inference_service_g1.py"
+CLIENT_PATH = REPO_ROOT / "g1_gr00t" / "source" / "g1_gr00t" / "g1_gr00t" / "gr00t_client.py"
+
+if not CLIENT_PATH.exists():
+    pytest.skip("Skipping test: G1 client not found", allow_module_level=True)
+
+
+def load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+server = load_module("inference_service_g1", SERVER_PATH)
+client_module = load_module("gr00t_client", CLIENT_PATH)
+
+STATE_KEYS = ["state.left_arm", "state.right_arm", "state.left_hand", "state.right_hand"]
+ACTION_KEYS = ["action.left_arm", "action.right_arm", "action.left_hand", "action.right_hand"]
+TASK = "pick up the cylinder ✓"
+
+
+@pytest.fixture
+def client():
+    return client_module.GR00TClient(task_description=TASK, protocol="flat")
+
+
+def make_observation(rng, height=4, width=6):
+    obs = {"video.rs_view": rng.integers(0, 256, (1, height, width, 3), dtype=np.uint8)}
+    for key in STATE_KEYS:
+        obs[key] = rng.standard_normal((1, 7))
+    obs["annotation.human.task_description"] = [TASK]
+    return obs
+
+
+def test_observation_round_trip(client):
+    obs = make_observation(np.random.default_rng(0))
+    decoded = server._unpack_flat_observation(memoryview(client._pack_flat_observation(obs)))
+
+    assert list(decoded) == ["video.rs_view", *STATE_KEYS, "annotation.human.task_description"]
+    assert decoded["video.rs_view"].dtype == np.uint8
+    assert decoded["video.rs_view"].shape == (1, 4, 6, 3)
+    np.testing.assert_array_equal(decoded["video.rs_view"], obs["video.rs_view"])
+    for key in STATE_KEYS:
+        assert decoded[key].dtype == np.float64
+        assert decoded[key].shape == (1, 7)
+        np.testing.assert_array_equal(decoded[key], obs[key])
+    assert decoded["annotation.human.task_description"] == [TASK]
+
+
+def test_observation_non_contiguous_image(client):
+    obs = make_observation(np.random.default_rng(1), height=8)
+    obs["video.rs_view"] = obs["video.rs_view"][:, ::2]
+    decoded = server._unpack_flat_observation(memoryview(client._pack_flat_observation(obs)))
+    np.testing.assert_array_equal(decoded["video.rs_view"], obs["video.rs_view"])
+
+
+@pytest.mark.parametrize("n_timesteps", [1, 16])
+def test_actions_round_trip(n_timesteps):
+    rng = np.random.default_rng(2)
+    result = {key: rng.standard_normal((n_timesteps, 7)) for key in ACTION_KEYS}
+    actions = client_module._unpack_flat_actions(memoryview(server._pack_flat_actions(result)))
+
+    assert actions.dtype == np.float32
+    assert actions.shape == (n_timesteps, 28)
+    assert actions.flags.writeable
+    # Columns follow left_arm, right_arm, left_hand, right_hand order
+    for i, key in enumerate(ACTION_KEYS):
+        np.testing.assert_array_equal(actions[:, 7 * i : 7 * (i + 1)], result[key].astype(np.float32))
+
+
+def test_bad_magic_rejected(client):
+    request = bytearray(client._pack_flat_observation(make_observation(np.random.default_rng(3))))
+    request[0] = 0x80
+    with pytest.raises(ValueError):
+        server._unpack_flat_observation(memoryview(request))
+
+    reply = bytearray(server._pack_flat_actions({key: np.zeros((2, 7)) for key in ACTION_KEYS}))
+    reply[0] = 0x80
+    with pytest.raises(ValueError):
+        client_module._unpack_flat_actions(memoryview(reply))
+
+
+def test_truncated_request_rejected(client):
+    request = client._pack_flat_observation(make_observation(np.random.default_rng(4)))
+    with pytest.raises(ValueError):
+        server._unpack_flat_observation(memoryview(request[:-1]))
@@ -0,0 +1,131 @@
+import io
+import warnings
+
+import msgpack
+import numpy as np
+import pytest
+import torch
+
+from gr00t.data.transform.state_action import Normalizer, StateActionToTensor
+from gr00t.data.transform.video import VideoToTensor
+from gr00t.eval.service import MsgSerializer
+
+
+def round_trip(value):
+    return MsgSerializer.from_bytes(MsgSerializer.to_bytes({"value": value}))["value"]
+
+
+@pytest.mark.parametrize(
+    "dtype", [np.bool_, np.uint8, np.int32, np.int64, np.float16, np.float32, np.float64]
+)
+def test_round_trip_dtypes(dtype):
+    array = (np.arange(24) % 3).astype(dtype).reshape(2, 3, 4)
+    decoded = round_trip(array)
+    assert decoded.dtype == array.dtype
+    assert decoded.shape == array.shape
+    np.testing.assert_array_equal(decoded, array)
+
+
+def test_round_trip_big_endian():
+    array = np.arange(6, dtype=">f4").reshape(2, 3)
+    decoded = round_trip(array)
+    assert decoded.dtype == array.dtype
+    np.testing.assert_array_equal(decoded, array)
+
+
+@pytest.mark.parametrize(
+    "make_view",
+    [
+        lambda a: a[:, ::2],  # strided
+        lambda a: a.T,  # Fortran order
+        lambda a: a[1:, 1:3],  # offset slice
+    ],
+)
+def test_round_trip_non_contiguous(make_view):
+    view = make_view(np.arange(30, dtype=np.float32).reshape(5, 6))
+    assert not view.flags.c_contiguous
+    decoded = round_trip(view)
+    assert decoded.shape == view.shape
+    assert decoded.flags.c_contiguous
+    np.testing.assert_array_equal(decoded, view)
+
+
+@pytest.mark.parametrize("array", [np.array(3.5), np.array(True), np.array(7, dtype=np.int16)])
+def test_round_trip_zero_dim(array):
+    decoded = round_trip(array)
+    assert decoded.shape == ()
+    assert decoded.dtype == array.dtype
+    assert decoded == array
+
+
+def test_round_trip_empty():
+    array = np.zeros((0, 7), dtype=np.float64)
+    decoded = round_trip(array)
+    assert decoded.shape == (0, 7)
+    assert decoded.dtype == np.float64
+
+
+def test_round_trip_nested_request():
+    request = {
+        "endpoint": "get_action",
+        "data": {
+            "video.rs_view": np.zeros((1, 4, 5, 3), dtype=np.uint8),
+            "state.left_arm": np.ones((1, 7)),
+            "annotation.human.task_description": ["pick up the cylinder"],
+        },
+    }
+    decoded = MsgSerializer.from_bytes(MsgSerializer.to_bytes(request))
+    assert decoded["endpoint"] == "get_action"
+    assert decoded["data"]["annotation.human.task_description"] == ["pick up the cylinder"]
+    for key in ("video.rs_view", "state.left_arm"):
+        np.testing.assert_array_equal(decoded["data"][key], request["data"][key])
+        assert decoded["data"][key].dtype == request["data"][key].dtype
+
+
+def test_object_arrays_rejected():
+    with pytest.raises(ValueError):
+        MsgSerializer.to_bytes({"value": np.array([{"a": 1}, None], dtype=object)})
+
+
+def test_decode_legacy_npy_payload():
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    payload = msgpack.packb({"value": {"__ndarray_class__": True, "as_npy": buffer.getvalue()}})
+    decoded = MsgSerializer.from_bytes(payload)["value"]
+    assert decoded.dtype == array.dtype
+    np.testing.assert_array_equal(decoded, array)
+
+
+def test_decoded_arrays_are_read_only():
+    decoded = round_trip(np.zeros((2, 3), dtype=np.float32))
+    assert not decoded.flags.writeable
+    # An in-place write fails loudly rather than touching the message buffer
+    with pytest.raises(ValueError):
+        decoded[0, 0] = 1.0
+
+
+def test_decoded_arrays_through_policy_input_transforms():
+    # The server hands decoded arrays to Gr00tPolicy. Its input transforms (as configured for
+    # unitree_g1) wrap them with torch.from_numpy, which ignores the read-only flag, so they must
+    # produce new tensors rather than write into the message buffer.
+    video = np.arange(2 * 4 * 5 * 3, dtype=np.uint8).reshape(2, 4, 5, 3)
+    state = np.linspace(-1, 1, 14).reshape(2, 7)
+    decoded_video = round_trip(video)
+    decoded_state = round_trip(state)
+
+    with warnings.catch_warnings():
+        # torch.from_numpy warns that the arrays are not writable
+        warnings.simplefilter("ignore", UserWarning)
+        video_tensor = VideoToTensor.to_tensor(decoded_video)
+        state_tensor = StateActionToTensor(apply_to=["state.left_arm"]).apply(
+            {"state.left_arm": decoded_state}
+        )["state.left_arm"]
+    normalized = Normalizer("min_max", {"min": [-2.0] * 7, "max": [2.0] * 7}).forward(state_tensor)
+
+    torch.testing.assert_close(
+        video_tensor, torch.from_numpy(video).float().permute(0, 3, 1, 2) / 255.0
+    )
+    torch.testing.assert_close(normalized, torch.from_numpy(state) / 2.0)
+    np.testing.assert_array_equal(decoded_video, video)
+    np.testing.assert_array_equal(decoded_state, state)
@@ -0,0 +1,74 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to convert USD assets into instanceable variants.
+
+Each input ``<name>.usd`` is written as ``<name>_instanceable.usd`` next to it, with its meshes moved
+into instanceable references so environment clones share one copy of the geometry. The robot and
+scene configurations pick up these variants automatically when they exist.
+
+Usage:
+    ./isaaclab.sh -p scripts/convert_instanceable.py \
+        assets/robots/g1-29dof_wholebody_dex3/g1_29dof_with_dex3_rev_1_0.usd \
+        assets/objects/small_warehouse/small_warehouse_digital_twin.usd \
+        assets/objects/PackingTable/PackingTable.usd \
+        assets/objects/PackingTable_2/PackingTable.usd
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Convert USD assets into instanceable variants.")
+parser.add_argument("usd_paths", nargs="+", help="USD files to convert.")
+parser.add_argument(
+    "--prim_path", type=str, default=None, help="Prim to convert below (defaults to each file's default prim)."
+)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import os
+
+from pxr import Usd
+
+try:
+    from isaacsim.core.utils.instanceable import convert_asset_instanceable
+except ImportError:
+    from omni.isaac.core.utils.instanceable import convert_asset_instanceable
+
+
+def main():
+    """Write an instanceable variant of every input USD file."""
+    for usd_path in args_cli.usd_paths:
+        usd_path = os.path.abspath(usd_path)
+        root, ext = os.path.splitext(usd_path)
+        save_as_path = f"{root}_instanceable{ext}"
+
+        prim_path = args_cli.prim_path
+        if prim_path is None:
+            prim_path = Usd.Stage.Open(usd_path).GetDefaultPrim().GetPath().pathString
+
+        convert_asset_instanceable(asset_usd_path=usd_path, source_prim_path=prim_path, save_as_path=save_as_path)
+        print(f"[INFO]: Wrote {save_as_path}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,92 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to bake the warehouse and packing tables of the cylinder scene into a single USD.
+
+The warehouse and both tables are referenced at the poses given in ``CylinderSceneCfg``, with the
+tables made kinematic, and the composed stage is flattened into ``assets/objects/warehouse_plus_tables.usd``.
+The scene configuration then references that one file instead of resolving three. Instanceable variants
+written by ``convert_instanceable.py`` are used as sources when they exist, so run that first.
+
+Usage:
+    ./isaaclab.sh -p scripts/merge_scene_assets.py
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Merge the cylinder scene environment assets into one USD.")
+parser.add_argument("--overwrite", action="store_true", default=False, help="Replace an existing merged USD.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import os
+
+from pxr import Gf, Usd, UsdGeom
+
+import isaaclab.sim as sim_utils
+
+from g1_gr00t.scene.cylinder_scene import ENVIRONMENT_USD_PATH, CylinderSceneCfg
+
+
+def main():
+    """Write the merged environment USD."""
+    if os.path.isfile(ENVIRONMENT_USD_PATH):
+        if not args_cli.overwrite:
+            print(f"[INFO]: {ENVIRONMENT_USD_PATH} already exists, pass --overwrite to regenerate it")
+            return
+        # Remove it first: the scene config only lists the separate assets while it is absent
+        os.remove(ENVIRONMENT_USD_PATH)
+
+    scene_cfg = CylinderSceneCfg(num_envs=1, env_spacing=0.0)
+    parts = {
+        "Room": scene_cfg.room_walls,
+        "PackingTable_1": scene_cfg.packing_table1,
+        "PackingTable_2": scene_cfg.packing_table2,
+    }
+
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.z)
+    root = UsdGeom.Xform.Define(stage, "/Environment").GetPrim()
+    stage.SetDefaultPrim(root)
+
+    for name, asset_cfg in parts.items():
+        prim_path = f"/Environment/{name}"
+        prim = UsdGeom.Xform.Define(stage, prim_path).GetPrim()
+        prim.GetReferences().AddReference(asset_cfg.spawn.usd_path)
+
+        # Same pose the scene would give the prim: init_state rot is (w, x, y, z)
+        pos, rot = asset_cfg.init_state.pos, asset_cfg.init_state.rot
+        xformable = UsdGeom.Xformable(prim)
+        xformable.ClearXformOpOrder()
+        xformable.AddTranslateOp(UsdGeom.XformOp.PrecisionDouble).Set(Gf.Vec3d(*pos))
+        xformable.AddOrientOp(UsdGeom.XformOp.PrecisionDouble).Set(Gf.Quatd(rot[0], Gf.Vec3d(*rot[1:])))
+
+        if asset_cfg.spawn.rigid_props is not None:
+            sim_utils.modify_rigid_body_properties(prim_path, asset_cfg.spawn.rigid_props, stage=stage)
+
+    stage.Flatten().Export(ENVIRONMENT_USD_PATH)
+    print(f"[INFO]: Wrote {ENVIRONMENT_USD_PATH}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
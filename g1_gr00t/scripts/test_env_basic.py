@@ -60,9 +60,12 @@ def main():
     
     # Try a few random steps
     print("\n[INFO]: Running 10 random steps...")
+    # The (batched) action space is (num_envs, action_dim)
+    num_envs, action_dim = env.unwrapped.num_envs, env.action_space.shape[-1]
+    actions = torch.empty((num_envs, action_dim), device=env.unwrapped.device)
     for i in range(10):
         # Random actions
-        actions = torch.randn(env.num_envs, env.action_space.shape[0], device=env.unwrapped.device) * 0.1
+        actions.normal_(mean=0.0, std=0.1)
         obs, reward, terminated, truncated, info = env.step(actions)
         
         if i % 5 == 0:
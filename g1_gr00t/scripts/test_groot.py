@@ -15,8 +15,29 @@ parser.add_argument("--task", type=str, default="G1-Move-Cylinder-Dex3-v0", help
 parser.add_argument("--groot_host", type=str, default="localhost", help="GR00T server host.")
 parser.add_argument("--groot_port", type=int, default=5555, help="GR00T server port.")
 parser.add_argument("--task_description", type=str, default="pick up the cylinder", help="Task description.")
+parser.add_argument(
+    "--prefetch_margin",
+    type=int,
+    default=5,
+    help="Request the next action chunk in the background when this many actions remain (0 disables).",
+)
+parser.add_argument(
+    "--groot_protocol",
+    type=str,
+    default="msgpack",
+    choices=["msgpack", "flat"],
+    help="Wire format of get_action messages; 'flat' needs the logging inference server and no API token.",
+)
 parser.add_argument("--video", action="store_true", help="Record video.")
 parser.add_argument("--video_length", type=int, default=500, help="Video length in steps.")
+parser.add_argument(
+    "--video_codec", type=str, default="h264_nvenc", help="Video encoder; falls back to libx264 if unavailable."
+)
+parser.add_argument(
+    "--combined_video",
+    action="store_true",
+    help="Record all PyAV cameras as streams of one all_cameras.mp4 written by a single encoder process.",
+)
 AppLauncher.add_app_launcher_args(parser)
 args_cli = parser.parse_args()
 
@@ -32,16 +53,245 @@ simulation_app = app_launcher.app
 
 import gymnasium as gym
 import torch
+import logging
 import os
-import json
+import sys
+import threading
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-import numpy as np
-import av
+from queue import Queue, SimpleQueue
+import orjson
+
+try:
+    import PyNvVideoCodec as pnvc
+except ImportError:
+    pnvc = None
 
 from isaaclab_tasks.utils import parse_env_cfg
 import g1_gr00t.tasks  # noqa: F401
-from g1_gr00t.tasks.move_cylinder.gr00t_client import create_groot_client
+from g1_gr00t.gr00t_client import create_groot_client
+from video_encoding import FrameEncodeProcess, H264Muxer
+
+# The GR00T client reports through logging; print its INFO messages like the rest of this script
+_client_logger = logging.getLogger("g1_gr00t")
+_client_logger.setLevel(logging.INFO)
+_client_logger.addHandler(logging.StreamHandler(sys.stdout))
+
+# Body/hand states are block-concatenated [positions, velocities, torques]
+NUM_BODY_JOINTS = 29
+NUM_HAND_JOINTS = 14
+# Arm and hand slices of the 43-DOF [body, hand] position vector (matching the client)
+LEFT_ARM = slice(15, 22)
+LEFT_HAND = slice(22, 29)
+RIGHT_ARM = slice(29, 36)
+RIGHT_HAND = slice(36, 43)
+
+
+# BT.601 limited-range RGB -> YUV
+_RGB_TO_YUV = ((0.257, 0.504, 0.098), (-0.148, -0.291, 0.439), (0.439, -0.368, -0.071))
+_YUV_OFFSET = (16.0, 128.0, 128.0)
+# Device -> (transposed matrix, offset) tensors, uploaded once per device rather than per frame
+_yuv_constants = {}
+
+
+def rgb_to_nv12(rgb: torch.Tensor, out: torch.Tensor):
+    """Convert an (H, W, 3+) RGB frame in [0, 255] to NV12 in ``out`` ((H * 3 / 2, W) uint8) on its device."""
+    height, width = rgb.shape[:2]
+    constants = _yuv_constants.get(rgb.device)
+    if constants is None:
+        constants = _yuv_constants[rgb.device] = (
+            torch.tensor(_RGB_TO_YUV, device=rgb.device).T,
+            torch.tensor(_YUV_OFFSET, device=rgb.device),
+        )
+    matrix_t, offset = constants
+    yuv = torch.addmm(offset, rgb[..., :3].reshape(-1, 3).float(), matrix_t)
+    yuv = yuv.view(height, width, 3)
+    out[:height] = yuv[..., 0].round_().clamp_(0, 255)
+    # 2x2-averaged chroma, interleaved as UVUV...
+    uv = yuv[..., 1:].view(height // 2, 2, width // 2, 2, 2).mean(dim=(1, 3))
+    out[height:] = uv.round_().clamp_(0, 255).view(height // 2, width)
+
+
+class NV12Frame:
+    """NV12 frame in device memory, exposed to PyNvVideoCodec as one CUDA array per plane."""
+
+    def __init__(self, buffer: torch.Tensor, height: int, width: int):
+        self.planes = [buffer[:height].unsqueeze(-1), buffer[height:].view(height // 2, width // 2, 2)]
+
+    def cuda(self):
+        return [plane.__cuda_array_interface__ for plane in self.planes]
+
+
+def create_gpu_encoder(width: int, height: int):
+    """Create a PyNvVideoCodec NVENC encoder that takes NV12 frames straight from device memory."""
+    device = torch.device(args_cli.device)
+    return pnvc.CreateEncoder(
+        width, height, "NV12", False,
+        codec="h264", preset="P4", tuning_info="low_latency", rc="vbr", fps=50, gpu_id=device.index or 0,
+    )
+
+
+def setup_recording(env, video_dir: Path) -> dict:
+    """Open the video encoders of the scene cameras and start a frame thread per camera.
+
+    Frames on the GPU go straight to NVENC through PyNvVideoCodec when it is installed; everything
+    else is read back and encoded with PyAV in an encoder process (see video_encoding.py).
+
+    Each recorded camera gets a ring of frame buffers and a thread: the sim loop only queues a
+    non-blocking readback (into the encoder process' pinned shared-memory ring for PyAV, device
+    NV12 for PyNvVideoCodec), and the thread waits for it and hands it to the encoder.
+    The bounded queue blocks the sim loop if the encoder falls behind rather than dropping frames.
+
+    Returns:
+        The recorder of each recorded camera, see :func:`queue_frame`.
+    """
+    # Frames in flight per camera: queued for the encoder + being encoded + being written
+    encode_queue_size = 4
+    num_frame_buffers = encode_queue_size + 2
+    print(f"[INFO]: Recording videos to {video_dir}")
+
+    # Camera -> (encoder, muxer) for PyNvVideoCodec, (encoder process, stream index) for PyAV
+    gpu_encoders = {}
+    video_encoders = {}
+    pyav_cameras = {}
+    for sensor_name, sensor in getattr(env.unwrapped.scene, 'sensors', {}).items():
+        if 'camera' not in sensor_name.lower():
+            continue
+        try:
+            rgb = sensor.data.output['rgb'][0]
+            height, width = rgb.shape[:2]
+
+            if pnvc is not None and args_cli.video_codec == "h264_nvenc" and rgb.is_cuda:
+                try:
+                    # NVENC's bitstream is muxed into <camera>.mp4 as is, like the PyAV recordings
+                    gpu_encoders[sensor_name] = (
+                        create_gpu_encoder(width, height),
+                        H264Muxer(video_dir / f"{sensor_name}.mp4", width, height, fps=50),
+                    )
+                    print(f"[INFO]: Recording {sensor_name} ({width}x{height}) at 50 fps with PyNvVideoCodec")
+                    continue
+                except Exception as e:
+                    print(f"[WARNING]: PyNvVideoCodec unavailable for {sensor_name} ({e}), using PyAV")
+
+            pyav_cameras[sensor_name] = (width, height)
+        except Exception as e:
+            print(f"[WARNING]: Could not setup recording for {sensor_name}: {e}")
+
+    # PyAV encoder processes fed through shared-memory frame rings: one per camera, or one
+    # writing every camera as a stream of a single container
+    if args_cli.combined_video:
+        groups = {"all_cameras": list(pyav_cameras)} if pyav_cameras else {}
+    else:
+        groups = {sensor_name: [sensor_name] for sensor_name in pyav_cameras}
+    for file_name, cameras in groups.items():
+        try:
+            video_encoder = FrameEncodeProcess(
+                video_dir / f"{file_name}.mp4",
+                [pyav_cameras[sensor_name] for sensor_name in cameras],
+                num_frame_buffers,
+                fps=50,
+                codec=args_cli.video_codec,
+                gpu=torch.device(args_cli.device).index or 0,
+            )
+            for index, sensor_name in enumerate(cameras):
+                video_encoders[sensor_name] = (video_encoder, index)
+        except Exception as e:
+            print(f"[WARNING]: Could not setup recording for {file_name}.mp4: {e}")
+
+    recorders = {}
+    for sensor_name in [*video_encoders, *gpu_encoders]:
+        rgb = env.unwrapped.scene.sensors[sensor_name].data.output['rgb'][0]
+        if sensor_name in gpu_encoders:
+            height, width = rgb.shape[:2]
+            buffers = [torch.empty((height * 3 // 2, width), dtype=torch.uint8, device=rgb.device) for _ in range(num_frame_buffers)]
+        else:
+            video_encoder, index = video_encoders[sensor_name]
+            ring = torch.from_numpy(video_encoder.buffers[index])
+            if rgb.is_cuda:
+                # Page-lock the shared ring so readbacks into it stay asynchronous
+                torch.cuda.cudart().cudaHostRegister(ring.data_ptr(), ring.numel(), 0)
+            buffers = list(ring.unbind())
+        recorder = recorders[sensor_name] = {
+            "gpu_encoder": gpu_encoders.get(sensor_name),
+            "video_encoder": video_encoders.get(sensor_name),
+            "buffers": buffers,
+            "events": [torch.cuda.Event() if rgb.is_cuda else None for _ in range(num_frame_buffers)],
+            # Float frames are clamped and scaled in place here before the uint8 readback
+            "scratch": torch.empty_like(rgb) if rgb.is_floating_point() else None,
+            "slot": 0,
+            "queue": Queue(maxsize=encode_queue_size),
+            "frames_written": 0,
+        }
+        recorder["thread"] = threading.Thread(target=encode_loop, args=(sensor_name, recorder), daemon=True)
+        recorder["thread"].start()
+    return recorders
+
+
+def queue_frame(recorder: dict, rgb: torch.Tensor):
+    """Queue the readback (cast to uint8) or NV12 conversion of a camera frame and hand it to the frame thread."""
+    if recorder["scratch"] is not None:
+        rgb = torch.clamp(rgb, 0, 1, out=recorder["scratch"]).mul_(255)
+    if recorder["gpu_encoder"] is not None:
+        slot = recorder["slot"]
+        recorder["slot"] = (slot + 1) % len(recorder["buffers"])
+        rgb_to_nv12(rgb, out=recorder["buffers"][slot])
+    else:
+        # Only slots the encoder process has copied out may be rewritten
+        video_encoder, index = recorder["video_encoder"]
+        slot = video_encoder.acquire(index)
+        recorder["buffers"][slot].copy_(rgb, non_blocking=True)
+    if recorder["events"][slot] is not None:
+        recorder["events"][slot].record()
+    recorder["queue"].put(slot)
+
+
+def encode_loop(sensor_name: str, recorder: dict):
+    """Frame thread: wait for each queued frame and pass it to the encoder until None is queued."""
+    while (slot := recorder["queue"].get()) is not None:
+        try:
+            if recorder["events"][slot] is not None:
+                recorder["events"][slot].synchronize()
+            buffer = recorder["buffers"][slot]
+            if recorder["gpu_encoder"] is not None:
+                encoder, muxer = recorder["gpu_encoder"]
+                height = buffer.shape[0] * 2 // 3
+                muxer.write(bytes(encoder.Encode(NV12Frame(buffer, height, buffer.shape[1]))))
+            else:
+                video_encoder, index = recorder["video_encoder"]
+                video_encoder.submit(slot, index)
+            recorder["frames_written"] += 1
+        except Exception as e:
+            if recorder["frames_written"] == 0:  # Only print on first error
+                print(f"[WARNING]: Error writing frame for {sensor_name}: {e}")
+
+
+def close_recording(recorders: dict):
+    """Hand the queued frames to the encoders, then flush and close every video file."""
+    for sensor_name, recorder in recorders.items():
+        try:
+            # Let the thread hand over queued frames to its encoder
+            recorder["queue"].put(None)
+            recorder["thread"].join()
+            if recorder["gpu_encoder"] is not None:
+                encoder, muxer = recorder["gpu_encoder"]
+                try:
+                    muxer.write(bytes(encoder.EndEncode()))
+                finally:
+                    muxer.close()
+                print(f"[INFO]: Saved {muxer.path.name} ({muxer.frames_written} frames)")
+            elif recorder["events"][0] is not None:
+                torch.cuda.cudart().cudaHostUnregister(recorder["buffers"][0].data_ptr())
+        except Exception as e:
+            print(f"[WARNING]: Error closing video for {sensor_name}: {e}")
+    video_encoders = {recorder["video_encoder"][0] for recorder in recorders.values() if recorder["video_encoder"]}
+    for video_encoder in video_encoders:
+        try:
+            # Let the encoder process finish queued frames and close the file
+            video_encoder.close()
+            print(f"[INFO]: Saved {video_encoder.path.name} ({sum(video_encoder.frames_received)} frames)")
+        except Exception as e:
+            print(f"[WARNING]: Error closing video {video_encoder.path.name}: {e}")
 
 
 def main():
@@ -56,9 +306,9 @@ def main():
     
     # Create environment
     print(f"[INFO]: Creating environment: {args_cli.task}")
-    render_mode = "rgb_array" if args_cli.video else None
+    # Videos are recorded from the scene cameras, so no viewport render is needed
     try:
-        env = gym.make(args_cli.task, cfg=env_cfg, render_mode=render_mode)
+        env = gym.make(args_cli.task, cfg=env_cfg, render_mode=None)
         print(f"[DEBUG]: gym.make() completed")
     except Exception as e:
         print(f"[ERROR]: Failed to create environment: {e}")
@@ -101,7 +351,9 @@ def main():
         host=args_cli.groot_host,
         port=args_cli.groot_port,
         task_description=args_cli.task_description,
-        log_dir=output_dir
+        log_dir=output_dir,
+        prefetch_margin=args_cli.prefetch_margin,
+        protocol=args_cli.groot_protocol,
     )
     
     print(f"[INFO]: Connecting to GR00T server at {args_cli.groot_host}:{args_cli.groot_port}...")
@@ -118,123 +370,135 @@ def main():
     
     # Set up robot state logging
     robot_log_file = output_dir / "robot_states.jsonl"
+    # Kept open for the whole run; unbuffered because the writer thread batches records itself
+    robot_log_fp = open(robot_log_file, 'ab', buffering=0)
+    log_opts = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+    # Serialized records are handed to a writer thread so file I/O stays off the sim loop;
+    # None stops it once everything queued before it has been written
+    robot_log_queue = SimpleQueue()
+    robot_log_batch_size = 64
+
+    def write_robot_log():
+        while True:
+            # Write what has queued since the last wake-up (up to a batch) with one syscall
+            records = [robot_log_queue.get()]
+            while len(records) < robot_log_batch_size and not robot_log_queue.empty():
+                records.append(robot_log_queue.get())
+            stop = records[-1] is None
+            if stop:
+                records.pop()
+            robot_log_fp.write(b"".join(records))
+            if stop:
+                return
+
+    robot_log_thread = threading.Thread(target=write_robot_log, daemon=True)
+    robot_log_thread.start()
     
     # Set up video recording if requested
-    video_containers = {}
-    video_streams = {}
+    recorders = {}
     video_dir = None
     if args_cli.video:
         video_dir = output_dir
-        print(f"[INFO]: Recording videos to {video_dir}")
-        
-        # Set up video writers for each camera using PyAV
-        if hasattr(env.unwrapped.scene, 'sensors'):
-            for sensor_name, sensor in env.unwrapped.scene.sensors.items():
-                if 'camera' in sensor_name.lower():
-                    try:
-                        first_frame = sensor.data.output['rgb'][0].cpu().numpy()
-                        height, width = first_frame.shape[:2]
-                        video_path = video_dir / f"{sensor_name}.mp4"
-                        
-                        # Create PyAV container with H.264 codec
-                        container = av.open(str(video_path), mode='w')
-                        stream = container.add_stream('h264', rate=50)  # 50 fps
-                        stream.width = width
-                        stream.height = height
-                        stream.pix_fmt = 'yuv420p'
-                        stream.options = {'crf': '23', 'preset': 'medium'}
-                        
-                        video_containers[sensor_name] = container
-                        video_streams[sensor_name] = stream
-                        print(f"[INFO]: Recording {sensor_name} ({width}x{height}) at 50 fps")
-                    except Exception as e:
-                        print(f"[WARNING]: Could not setup recording for {sensor_name}: {e}")
+        recorders = setup_recording(env, video_dir)
     
     print(f"\n[INFO]: Running simulation with GR00T policy...")
     print(f"[INFO]: Task: {args_cli.task_description}")
     
     step_count = 0
+    action_buffer = torch.empty((1, env.action_space.shape[-1]), device=env.unwrapped.device)
     max_steps = args_cli.video_length if args_cli.video else 1000
-    frames_written = {name: 0 for name in video_containers.keys()}
+
+    # Only the cameras that are being recorded, resolved once instead of scanning all sensors per step
+    recording_sensors = [(name, env.unwrapped.scene.sensors[name]) for name in recorders]
+
+    # Frame conversion and readback run on their own stream so they overlap with whatever the sim
+    # stream has queued behind the render
+    device = torch.device(env.unwrapped.device)
+    record_stream = torch.cuda.Stream(device=device) if device.type == "cuda" else None
+
+    def record_step():
+        if record_stream is not None:
+            # Wait for this step's render before reading the camera outputs
+            sim_stream = torch.cuda.current_stream(device)
+            record_stream.wait_stream(sim_stream)
+        with torch.cuda.stream(record_stream) if record_stream is not None else nullcontext():
+            for sensor_name, sensor in list(recording_sensors):
+                try:
+                    queue_frame(recorders[sensor_name], sensor.data.output['rgb'][0])
+                except Exception as e:
+                    # E.g. the encoder process exited: stop reading this camera back
+                    print(f"[WARNING]: Stopped recording {sensor_name}: {e}")
+                    recording_sensors.remove((sensor_name, sensor))
+        if record_stream is not None:
+            # The next step re-renders into the same camera buffers, so the sim stream may not run
+            # ahead of these reads; this is a device-side wait and does not block the host
+            sim_stream.wait_stream(record_stream)
+
+    recording = args_cli.video and recording_sensors
+
+    # The app is polled every few steps instead of crossing into Kit on every step
+    app_check_interval = 10
+    running = simulation_app.is_running()
     
     try:
-        while simulation_app.is_running() and step_count < max_steps:
+        while running and step_count < max_steps:
             with torch.inference_mode():
                 # Get action from GR00T
                 actions = groot_client.get_action(obs['policy'], env)
+                # One timestamp shared by both of this step's records
+                timestamp = datetime.now().isoformat()
                 
                 # Log action before sending to robot
                 action_before_log = {
                     "step": step_count + 1,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                     "type": "action_to_robot",
-                    "action": actions.cpu().numpy().tolist()
+                    "action": actions.cpu().numpy()
                 }
-                with open(robot_log_file, 'a') as f:
-                    f.write(json.dumps(action_before_log) + '\n')
+                robot_log_queue.put(orjson.dumps(action_before_log, option=log_opts))
                 
-                # Expand to batch dimension
-                actions = actions.unsqueeze(0).to(env.unwrapped.device)
+                # Expand to batch dimension (reusing one device buffer)
+                action_buffer[0].copy_(actions)
+                actions = action_buffer
                 
                 # Step environment
                 obs, reward, terminated, truncated, info = env.step(actions)
                 step_count += 1
+                if step_count % app_check_interval == 0:
+                    running = simulation_app.is_running()
                 
-                # Log actual robot state after action injection
-                body_state = obs['policy']['robot_body_state'][0].cpu().numpy()
-                hand_state = obs['policy']['robot_hand_state'][0].cpu().numpy()
-                
-                # Extract joint positions (every 3rd value)
-                body_positions = body_state[::3]
-                hand_positions = hand_state[::3]
-                full_state = np.concatenate([body_positions, hand_positions])
-                
-                # Extract arm and hand positions (indices matching client)
-                left_arm_indices = list(range(15, 22))
-                right_arm_indices = list(range(29, 36))
-                left_hand_indices = list(range(22, 29))
-                right_hand_indices = list(range(36, 43))
+                # Log actual robot state after action injection: only the joint positions (the leading
+                # block of each state) are gathered on device and copied to the host
+                full_state = torch.cat((
+                    obs['policy']['robot_body_state'][0, :NUM_BODY_JOINTS],
+                    obs['policy']['robot_hand_state'][0, :NUM_HAND_JOINTS],
+                )).cpu().float().numpy()
+                # Read the reward once: each .item() is a device sync
+                reward_value = float(reward[0].item())
                 
                 actual_state_log = {
                     "step": step_count,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                     "type": "robot_actual_state",
                     "joint_positions": {
-                        "left_arm": full_state[left_arm_indices].tolist(),
-                        "right_arm": full_state[right_arm_indices].tolist(),
-                        "left_hand": full_state[left_hand_indices].tolist(),
-                        "right_hand": full_state[right_hand_indices].tolist()
+                        "left_arm": full_state[LEFT_ARM],
+                        "right_arm": full_state[RIGHT_ARM],
+                        "left_hand": full_state[LEFT_HAND],
+                        "right_hand": full_state[RIGHT_HAND]
                     },
-                    "full_state": full_state.tolist(),
-                    "reward": float(reward[0].item())
+                    "full_state": full_state,
+                    "reward": reward_value
                 }
-                with open(robot_log_file, 'a') as f:
-                    f.write(json.dumps(actual_state_log) + '\n')
+                robot_log_queue.put(orjson.dumps(actual_state_log, option=log_opts))
                 
-                # Record video frames using PyAV
-                if args_cli.video and video_containers:
-                    for sensor_name, sensor in env.unwrapped.scene.sensors.items():
-                        if sensor_name in video_containers:
-                            try:
-                                img_data = sensor.data.output['rgb'][0].cpu().numpy()
-                                if img_data.dtype != np.uint8:
-                                    img_data = (np.clip(img_data, 0, 1) * 255).astype(np.uint8)
-                                
-                                # Create PyAV VideoFrame from numpy array
-                                frame = av.VideoFrame.from_ndarray(img_data, format='rgb24')
-                                
-                                # Encode and write frame
-                                for packet in video_streams[sensor_name].encode(frame):
-                                    video_containers[sensor_name].mux(packet)
-                                
-                                frames_written[sensor_name] += 1
-                            except Exception as e:
-                                if step_count == 1:  # Only print on first error
-                                    print(f"[WARNING]: Error writing frame for {sensor_name}: {e}")
+                # Record video frames
+                if recording:
+                    record_step()
                 
                 # Print progress
                 if step_count % 50 == 0:
-                    print(f"[INFO]: Step {step_count}/{max_steps}, Reward: {reward[0].item():.4f}")
+                    print(f"[INFO]: Step {step_count}/{max_steps}, Reward: {reward_value:.4f}")
                 
                 # Reset if done
                 if terminated[0] or truncated[0]:
@@ -246,22 +510,14 @@ def main():
     
     finally:
         # Close video containers and flush remaining packets
-        if args_cli.video and video_containers:
-            for sensor_name, container in video_containers.items():
-                try:
-                    # Flush remaining packets
-                    stream = video_streams[sensor_name]
-                    for packet in stream.encode():
-                        container.mux(packet)
-                    
-                    # Close container
-                    container.close()
-                    frame_count = frames_written.get(sensor_name, 0)
-                    print(f"[INFO]: Saved {sensor_name}.mp4 ({frame_count} frames)")
-                except Exception as e:
-                    print(f"[WARNING]: Error closing video for {sensor_name}: {e}")
+        if args_cli.video and recorders:
+            close_recording(recorders)
             print(f"[INFO]: Videos saved to {video_dir}")
         
+        robot_log_queue.put(None)
+        robot_log_thread.join()
+        robot_log_fp.close()
+
         # Disconnect GR00T
         groot_client.disconnect()
         
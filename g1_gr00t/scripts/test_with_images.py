@@ -34,26 +34,36 @@ import torch
 import numpy as np
 from PIL import Image
 
+try:
+    from turbojpeg import TJPF_RGB, TurboJPEG
+
+    _jpeg = TurboJPEG()
+except (ImportError, OSError):  # PyTurboJPEG or libjpeg-turbo not installed
+    _jpeg = None
+
 from isaaclab_tasks.utils import parse_env_cfg
 import g1_gr00t.tasks  # noqa: F401
 
 
 def save_image(data: torch.Tensor, path: str):
-    """Save image tensor to file."""
-    # Convert from torch tensor to numpy
-    img_np = data.cpu().numpy()
-    
+    """Save image tensor to file as JPEG (quality 85).
+
+    Uses libjpeg-turbo through PyTurboJPEG when it is installed, and PIL otherwise.
+    """
     # Handle different image formats
-    if img_np.ndim == 4:  # (batch, height, width, channels)
-        img_np = img_np[0]  # Take first image
+    if data.ndim == 4:  # (batch, height, width, channels)
+        data = data[0]  # Take first image
     
-    # Convert to uint8 if needed
-    if img_np.dtype == np.float32 or img_np.dtype == np.float64:
-        img_np = (img_np * 255).astype(np.uint8)
+    # Convert to uint8 on the tensor's device (a no-op for uint8 frames), then to numpy
+    if data.is_floating_point():
+        data = data * 255
+    img_np = data.to(torch.uint8).cpu().numpy()
     
-    # Create PIL image and save
-    img = Image.fromarray(img_np)
-    img.save(path)
+    if _jpeg is not None:
+        with open(path, 'wb') as f:
+            f.write(_jpeg.encode(np.ascontiguousarray(img_np), quality=85, pixel_format=TJPF_RGB))
+    else:
+        Image.fromarray(img_np).save(path, quality=85)
     print(f"[INFO]: Saved image to {path}")
 
 
@@ -92,6 +102,10 @@ def main():
     # Run for a few steps and capture observations
     print(f"\n[INFO]: Running simulation for 100 steps...")
     
+    # Resolve the scene cameras once instead of scanning all sensors on every capture
+    sensors = getattr(env.unwrapped.scene, 'sensors', {})
+    camera_sensors = [(name, sensor) for name, sensor in sensors.items() if 'camera' in name.lower()]
+
     for step in range(100):
         # Zero actions
         actions = torch.zeros(env.action_space.shape, device=env.unwrapped.device)
@@ -107,17 +121,15 @@ def main():
             print(f"  Reward: {reward[0].item():.4f}")
             
             # Try to get actual camera images from the scene if cameras exist
-            if hasattr(env.unwrapped.scene, 'sensors'):
-                for sensor_name, sensor in env.unwrapped.scene.sensors.items():
-                    if 'camera' in sensor_name.lower():
-                        try:
-                            if hasattr(sensor, 'data') and hasattr(sensor.data, 'output'):
-                                if 'rgb' in sensor.data.output:
-                                    img_data = sensor.data.output['rgb']
-                                    img_path = output_dir / f"{sensor_name}_step_{step:04d}.png"
-                                    save_image(img_data, str(img_path))
-                        except Exception as e:
-                            print(f"  [WARNING]: Could not save {sensor_name}: {e}")
+            for sensor_name, sensor in camera_sensors:
+                try:
+                    if hasattr(sensor, 'data') and hasattr(sensor.data, 'output'):
+                        if 'rgb' in sensor.data.output:
+                            img_data = sensor.data.output['rgb']
+                            img_path = output_dir / f"{sensor_name}_step_{step:04d}.jpg"
+                            save_image(img_data, str(img_path))
+                except Exception as e:
+                    print(f"  [WARNING]: Could not save {sensor_name}: {e}")
     
     print(f"\n[INFO]: Simulation complete. Check {output_dir} for saved images.")
     print("[INFO]: Scene contains:")
@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Quick verification that both tasks have identical structure, with Isaac AppLauncher."""
+"""Quick verification that both tasks have identical structure.
+
+The EnvCfg classes are plain configclasses, so they are first imported without a simulator; Isaac
+AppLauncher is only started if that fails (e.g. an import that needs a running Kit app).
+"""
 
 import argparse
 import sys
@@ -24,13 +28,6 @@ parser.add_argument(
 )
 args_cli = parser.parse_args()
 
-# -----------------------------------------------------------------------------
-# Launch the simulator context (headless, lightweight)
-# -----------------------------------------------------------------------------
-app_launcher = AppLauncher(args_cli)
-simulation_app = app_launcher.app
-
-# Now Isaac packages (isaaclab, omni.isaac, etc.) are importable
 import importlib
 
 # -----------------------------------------------------------------------------
@@ -51,10 +48,8 @@ def safe_get(obj, path):
 def fmt(v):
     return str(v) if v is not None else "—"
 
-# -----------------------------------------------------------------------------
-# Load and compare EnvCfgs
-# -----------------------------------------------------------------------------
-try:
+
+def load_configs():
     CylCls = import_class(args_cli.cylinder)
     NutCls = import_class(args_cli.nutpour)
     print("✅ Imported both EnvCfg classes successfully.\n")
@@ -62,10 +57,30 @@ try:
     cyl = CylCls()
     nut = NutCls()
     print("✅ Instantiated both EnvCfgs.\n")
+    return cyl, nut
+
+# -----------------------------------------------------------------------------
+# Load and compare EnvCfgs
+# -----------------------------------------------------------------------------
+simulation_app = None
+try:
+    # Booting the simulator takes tens of seconds and is not needed to read the configs
+    cyl, nut = load_configs()
 except Exception as e:
-    print(f"❌ Failed to import or instantiate configs: {e}")
-    simulation_app.close()
-    sys.exit(1)
+    print(f"[INFO]: Could not load configs without the simulator ({e}), launching it")
+    # -------------------------------------------------------------------------
+    # Launch the simulator context (headless, lightweight)
+    # -------------------------------------------------------------------------
+    app_launcher = AppLauncher(args_cli)
+    simulation_app = app_launcher.app
+
+    # Now Isaac packages (isaaclab, omni.isaac, etc.) are importable
+    try:
+        cyl, nut = load_configs()
+    except Exception as e:
+        print(f"❌ Failed to import or instantiate configs: {e}")
+        simulation_app.close()
+        sys.exit(1)
 
 settings = [
     "decimation",
@@ -114,6 +129,7 @@ print("=" * 72)
 # -----------------------------------------------------------------------------
 # Cleanup
 # -----------------------------------------------------------------------------
-simulation_app.close()
+if simulation_app is not None:
+    simulation_app.close()
 sys.exit(0 if all_match else 1)
 
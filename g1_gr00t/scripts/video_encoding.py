@@ -0,0 +1,268 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Out-of-process H.264 recording of camera frames through shared-memory rings.
+
+The simulation process writes each RGB frame into a free slot of its camera's shared-memory ring and
+sends the slot index to an encoder process, which copies the frame out, hands the slot back and
+encodes it with PyAV (NVENC when available). Encoding and muxing never hold the simulation process'
+GIL. One encoder process writes one container, which may hold a stream per camera.
+
+:class:`H264Muxer` writes an already encoded H.264 bitstream (PyNvVideoCodec's NVENC output) to a
+container without re-encoding it.
+
+Run as a script, this module is the encoder process; it is not meant to be launched by hand.
+"""
+
+import argparse
+import subprocess
+import sys
+import threading
+from fractions import Fraction
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from queue import Empty, Queue
+
+import numpy as np
+
+
+class FrameEncodeProcess:
+    """Encoder process writing one video stream per entry of ``frame_sizes`` (``(width, height)``) to ``path``.
+
+    Each stream is fed through its own ring of ``num_slots`` shared-memory frame buffers:
+    ``buffers[stream]`` is a ``(num_slots, height, width, 3)`` uint8 view of it. A slot obtained from
+    :meth:`acquire` may be written until it is passed to :meth:`submit`. Both raise ``RuntimeError``
+    once the encoder process has exited.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        frame_sizes: list[tuple[int, int]],
+        num_slots: int,
+        fps: int = 50,
+        codec: str = "h264_nvenc",
+        gpu: int = 0,
+    ):
+        self.path = path
+        self._shms = [
+            shared_memory.SharedMemory(create=True, size=num_slots * height * width * 3)
+            for width, height in frame_sizes
+        ]
+        self.buffers = [
+            np.ndarray((num_slots, height, width, 3), dtype=np.uint8, buffer=shm.buf)
+            for (width, height), shm in zip(frame_sizes, self._shms)
+        ]
+        # Frames the encoder process has copied out of each ring; all of them are in the file once
+        # close() returns
+        self.frames_received = [0] * len(frame_sizes)
+
+        self._free_slots = [Queue() for _ in frame_sizes]
+        for free_slots in self._free_slots:
+            for slot in range(num_slots):
+                free_slots.put(slot)
+
+        # "<stream> <slot>" lines go in on stdin and come back on stdout once the frame has been copied out
+        streams = [f"{shm.name}:{width}:{height}" for (width, height), shm in zip(frame_sizes, self._shms)]
+        self._process = subprocess.Popen(
+            [
+                sys.executable, __file__, str(path), *streams,
+                "--num_slots", str(num_slots),
+                "--fps", str(fps),
+                "--codec", codec,
+                "--gpu", str(gpu),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._reader = threading.Thread(target=self._collect_free_slots, daemon=True)
+        self._reader.start()
+
+    def acquire(self, stream: int = 0, poll_interval: float = 1.0) -> int:
+        """Return a free slot of ``stream``, blocking while all of them are still queued for encoding."""
+        while True:
+            try:
+                return self._free_slots[stream].get(timeout=poll_interval)
+            except Empty:
+                # An exited encoder process never hands the remaining slots back
+                if self._process.poll() is not None:
+                    raise RuntimeError(self._exit_message()) from None
+
+    def submit(self, slot: int, stream: int = 0):
+        """Queue a written slot of ``stream`` for encoding."""
+        try:
+            self._process.stdin.write(b"%d %d\n" % (stream, slot))
+            self._process.stdin.flush()
+        except BrokenPipeError:
+            self._process.wait()
+            raise RuntimeError(self._exit_message()) from None
+
+    def close(self):
+        """Let the encoder process finish queued frames and close its file.
+
+        Raises ``RuntimeError`` if the encoder process failed, in which case the file is incomplete.
+        """
+        try:
+            try:
+                self._process.stdin.close()
+            except BrokenPipeError:
+                pass
+            self._process.wait()
+            self._reader.join()
+            if self._process.returncode != 0:
+                raise RuntimeError(self._exit_message())
+        finally:
+            for shm in self._shms:
+                try:
+                    shm.close()
+                except BufferError:
+                    # Views of the ring are still alive; the mapping goes away with them
+                    pass
+                shm.unlink()
+
+    def _collect_free_slots(self):
+        for line in self._process.stdout:
+            stream, slot = map(int, line.split())
+            self._free_slots[stream].put(slot)
+            self.frames_received[stream] += 1
+
+    def _exit_message(self) -> str:
+        return f"Encoder process for {self.path.name} exited with code {self._process.returncode}"
+
+
+def open_video_stream(container, width: int, height: int, codec: str, fps: int, gpu: int = 0):
+    """Add an H.264 stream to ``container``, preferring ``codec`` and falling back to libx264.
+
+    NVENC (``h264_nvenc``) keeps encoding off the CPU, which otherwise competes with the simulation.
+    """
+    import av
+
+    options = _video_codec_options(codec, gpu)
+    try:
+        # Probe with a standalone context so an unusable encoder (no NVIDIA driver, FFmpeg built
+        # without NVENC) is detected before a stream is added to the container
+        probe = av.codec.CodecContext.create(codec, "w")
+        probe.width = width
+        probe.height = height
+        probe.pix_fmt = "yuv420p"
+        probe.options = options
+        probe.open()
+    except Exception as e:
+        if codec == "h264":
+            raise
+        print(f"[WARNING]: Video codec {codec} unavailable ({e}), falling back to h264", file=sys.stderr)
+        codec, options = "h264", _video_codec_options("h264", gpu)
+
+    stream = container.add_stream(codec, rate=fps)
+    stream.width = width
+    stream.height = height
+    stream.pix_fmt = "yuv420p"
+    stream.options = options
+    return stream
+
+
+def _video_codec_options(codec: str, gpu: int) -> dict[str, str]:
+    if codec == "h264_nvenc":
+        # Low-latency tuning: no B-frame lookahead, so frames are emitted as they are encoded
+        return {"preset": "p4", "tune": "ll", "rc": "vbr", "cq": "23", "gpu": str(gpu)}
+    return {"crf": "23", "preset": "medium"}
+
+
+class H264Muxer:
+    """Muxes an H.264 Annex B bitstream into ``path`` (e.g. an .mp4) at ``fps``, without re-encoding.
+
+    The bitstream may be written in arbitrary chunks; FFmpeg's H.264 parser splits it into frames,
+    which are timestamped in order. The stream must not contain B-frames (true for NVENC's
+    low-latency tuning), so decode order is presentation order.
+    """
+
+    def __init__(self, path: Path, width: int, height: int, fps: int):
+        import av
+
+        self.path = path
+        self.frames_written = 0
+        self._time_base = Fraction(1, fps)
+        self._parser = av.CodecContext.create("h264", "r")
+        self._container = av.open(str(path), mode="w")
+        self._stream = self._container.add_stream("h264", rate=fps)
+        self._stream.width = width
+        self._stream.height = height
+
+    def write(self, data: bytes | None):
+        """Mux the frames completed by ``data``; ``None`` flushes the parser."""
+        for packet in self._parser.parse(data):
+            packet.stream = self._stream
+            packet.time_base = self._time_base
+            packet.pts = packet.dts = self.frames_written
+            self._container.mux(packet)
+            self.frames_written += 1
+
+    def close(self):
+        """Mux the last buffered frame and finalize the container."""
+        try:
+            self.write(None)
+        finally:
+            self._container.close()
+
+
+def main():
+    """Encoder process: encode the slots named on stdin and echo each one back once it is free."""
+    import av
+
+    parser = argparse.ArgumentParser(description="Shared-memory frame encoder process.")
+    parser.add_argument("path", type=Path, help="Output video file.")
+    parser.add_argument("streams", nargs="+", help="One <shared memory name>:<width>:<height> per stream.")
+    parser.add_argument("--num_slots", type=int, required=True)
+    parser.add_argument("--fps", type=int, default=50)
+    parser.add_argument("--codec", type=str, default="h264_nvenc")
+    parser.add_argument("--gpu", type=int, default=0)
+    args = parser.parse_args()
+
+    container = av.open(str(args.path), mode="w")
+    shms, rings, streams, frames, frame_rows = [], [], [], [], []
+    for spec in args.streams:
+        name, width, height = spec.rsplit(":", 2)
+        width, height = int(width), int(height)
+        shm = shared_memory.SharedMemory(name=name)
+        # The simulation process owns the ring; keep this process' resource tracker from unlinking it
+        resource_tracker.unregister(shm._name, "shared_memory")
+        shms.append(shm)
+        rings.append(np.ndarray((args.num_slots, height, width, 3), dtype=np.uint8, buffer=shm.buf))
+
+        stream = open_video_stream(container, width, height, args.codec, args.fps, args.gpu)
+        streams.append(stream)
+        print(
+            f"[INFO]: Recording {args.path.name} stream {len(streams) - 1} ({width}x{height}) at {args.fps} fps "
+            f"with {stream.codec_context.name}",
+            file=sys.stderr,
+        )
+
+        # One frame reused for every encode: both h264 encoders copy the picture on encode()
+        frame = av.VideoFrame(width, height, "rgb24")
+        plane = frame.planes[0]
+        frames.append(frame)
+        # Row stride may be padded past width * 3
+        frame_rows.append(np.frombuffer(plane, dtype=np.uint8).reshape(height, plane.line_size)[:, : width * 3])
+
+    for line in sys.stdin.buffer:
+        index, slot = map(int, line.split())
+        frame_rows[index][:] = rings[index][slot].reshape(frame_rows[index].shape)
+        # The slot can be rewritten as soon as it has been copied into the frame
+        sys.stdout.buffer.write(line)
+        sys.stdout.buffer.flush()
+        for packet in streams[index].encode(frames[index]):
+            container.mux(packet)
+
+    for stream in streams:
+        for packet in stream.encode():
+            container.mux(packet)
+    container.close()
+    del rings, frame_rows
+    for shm in shms:
+        shm.close()
+
+
+if __name__ == "__main__":
+    main()
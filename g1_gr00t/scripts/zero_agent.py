@@ -10,9 +10,8 @@
 import os
 from datetime import datetime
 import argparse
+from contextlib import nullcontext
 from pathlib import Path
-import cv2
-import numpy as np
 
 from isaaclab.app import AppLauncher
 
@@ -46,6 +45,63 @@ import torch
 from isaaclab_tasks.utils import parse_env_cfg
 
 import g1_gr00t.tasks  # noqa: F401
+from video_encoding import FrameEncodeProcess
+
+
+def setup_recording(camera_sensors: list, video_dir: Path, num_frame_buffers: int):
+    """Start an encoder process per camera with RGB output.
+
+    Returns:
+        The encoder processes, the (page-locked) host rings the frames are read back into and the
+        readback events of each ring slot, all keyed by camera name.
+    """
+    video_encoders = {}
+    host_buffers = {}
+    readback_events = {}
+    video_dir.mkdir(parents=True, exist_ok=True)
+    print(f"[INFO]: Recording videos to {video_dir}")
+    print(f"[INFO]: Video length: {args_cli.video_length} steps")
+
+    # Find all cameras in the scene and create video writers
+    for sensor_name, sensor in camera_sensors:
+        try:
+            if hasattr(sensor, 'data') and hasattr(sensor.data, 'output'):
+                if 'rgb' in sensor.data.output:
+                    rgb = sensor.data.output['rgb'][0]
+                    height, width = rgb.shape[:2]
+
+                    # Encoder process fed through a shared-memory frame ring
+                    video_encoders[sensor_name] = FrameEncodeProcess(
+                        video_dir / f"{sensor_name}.mp4",
+                        [(width, height)],
+                        num_frame_buffers,
+                        fps=20,
+                        gpu=rgb.device.index or 0,
+                    )
+
+                    # Frames are read back straight into the ring, page-locked so the copies stay async
+                    ring = torch.from_numpy(video_encoders[sensor_name].buffers[0])
+                    if rgb.is_cuda:
+                        torch.cuda.cudart().cudaHostRegister(ring.data_ptr(), ring.numel(), 0)
+                    host_buffers[sensor_name] = ring
+                    readback_events[sensor_name] = [
+                        torch.cuda.Event() if rgb.is_cuda else None for _ in range(num_frame_buffers)
+                    ]
+        except Exception as e:
+            print(f"[WARNING]: Could not setup recording for {sensor_name}: {e}")
+    return video_encoders, host_buffers, readback_events
+
+
+def close_recording(video_encoders: dict, host_buffers: dict, readback_events: dict):
+    """Let each encoder process finish its queued frames and close its file."""
+    for sensor_name, video_encoder in video_encoders.items():
+        if readback_events[sensor_name][0] is not None:
+            torch.cuda.cudart().cudaHostUnregister(host_buffers[sensor_name].data_ptr())
+        try:
+            video_encoder.close()
+            print(f"[INFO]: Saved {sensor_name}.mp4 ({video_encoder.frames_received[0]} frames)")
+        except Exception as e:
+            print(f"[WARNING]: Error closing video for {sensor_name}: {e}")
 
 
 def main():
@@ -73,40 +129,19 @@ def main():
     # reset environment first
     env.reset()
     
+    # Resolve the scene cameras once instead of scanning all sensors per step
+    sensors = getattr(env.unwrapped.scene, 'sensors', {})
+    camera_sensors = [(name, sensor) for name, sensor in sensors.items() if 'camera' in name.lower()]
+
     # Set up video recording from scene cameras if requested
-    video_writers = {}
+    # Frames in flight per camera: being written + waiting a step for its copy + in the encoder
+    num_frame_buffers = 4
+    video_encoders, host_buffers, readback_events = {}, {}, {}
     video_dir = None
     if args_cli.video:
         video_dir = Path(f"videos/{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}/{args_cli.task}")
-        video_dir.mkdir(parents=True, exist_ok=True)
-        print(f"[INFO]: Recording videos to {video_dir}")
-        print(f"[INFO]: Video length: {args_cli.video_length} steps")
-        
-        # Find all cameras in the scene and create video writers
-        if hasattr(env.unwrapped.scene, 'sensors'):
-            for sensor_name, sensor in env.unwrapped.scene.sensors.items():
-                if 'camera' in sensor_name.lower():
-                    try:
-                        if hasattr(sensor, 'data') and hasattr(sensor.data, 'output'):
-                            if 'rgb' in sensor.data.output:
-                                # Get first frame to determine dimensions
-                                first_frame = sensor.data.output['rgb'][0].cpu().numpy()
-                                height, width = first_frame.shape[:2]
-                                
-                                # Create video writer
-                                video_path = video_dir / f"{sensor_name}.mp4"
-                                fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-                                fps = 20
-                                writer = cv2.VideoWriter(str(video_path), fourcc, fps, (width, height))
-                                
-                                if writer.isOpened():
-                                    video_writers[sensor_name] = writer
-                                    print(f"[INFO]: Recording {sensor_name} ({width}x{height})")
-                                else:
-                                    print(f"[WARNING]: Could not open video writer for {sensor_name}")
-                    except Exception as e:
-                        print(f"[WARNING]: Could not setup recording for {sensor_name}: {e}")
-    
+        video_encoders, host_buffers, readback_events = setup_recording(camera_sensors, video_dir, num_frame_buffers)
+
     # simulate environment
     from isaacsim.core.utils.extensions import enable_extension
     enable_extension("omni.services.livestream.nvcf")
@@ -128,44 +163,86 @@ def main():
     step_count = 0
     max_steps = args_cli.video_length if args_cli.video else float('inf')
     
-    while simulation_app.is_running() and step_count < max_steps:
+    # Frame readbacks run on their own stream so they overlap with the sim stream; each frame is
+    # encoded one step later, once its copy has had a full env.step to land
+    device = torch.device(env.unwrapped.device)
+    record_stream = torch.cuda.Stream(device=device) if device.type == "cuda" else None
+    recording_sensors = [(name, sensor) for name, sensor in camera_sensors if name in video_encoders]
+    pending_slots = None
+
+    def stop_recording(sensor_name, e):
+        # The encoder process is gone (or unusable): stop reading the camera back
+        print(f"[WARNING]: Stopped recording {sensor_name}: {e}")
+        recording_sensors[:] = [(name, sensor) for name, sensor in recording_sensors if name != sensor_name]
+
+    def encode_frames(slots):
+        for sensor_name, slot in slots.items():
+            try:
+                event = readback_events[sensor_name][slot]
+                if event is not None and not event.query():
+                    event.synchronize()
+                video_encoders[sensor_name].submit(slot)
+            except Exception as e:
+                stop_recording(sensor_name, e)
+
+    # zero actions, allocated once: env.step never writes to them
+    actions = torch.zeros(env.action_space.shape, device=env.unwrapped.device)
+
+    # The app is polled every few steps instead of crossing into Kit on every step
+    app_check_interval = 10
+    running = simulation_app.is_running()
+
+    while running and step_count < max_steps:
         # run everything in inference mode
         with torch.inference_mode():
-            # compute zero actions
-            actions = torch.zeros(env.action_space.shape, device=env.unwrapped.device)
             # apply actions
             env.step(actions)
             step_count += 1
+            if step_count % app_check_interval == 0:
+                running = simulation_app.is_running()
             
             # Capture frames from all cameras if recording
-            if args_cli.video and video_writers:
-                if hasattr(env.unwrapped.scene, 'sensors'):
-                    for sensor_name, sensor in env.unwrapped.scene.sensors.items():
-                        if sensor_name in video_writers:
-                            try:
-                                img_data = sensor.data.output['rgb'][0].cpu().numpy()
-                                
-                                # Convert to uint8 if needed
-                                if img_data.dtype != np.uint8:
-                                    img_data = (np.clip(img_data, 0, 1) * 255).astype(np.uint8)
-                                
-                                # Convert RGB to BGR for OpenCV
-                                frame_bgr = cv2.cvtColor(img_data, cv2.COLOR_RGB2BGR)
-                                
-                                # Write frame
-                                video_writers[sensor_name].write(frame_bgr)
-                            except Exception as e:
-                                if step_count == 1:  # Only print error once
-                                    print(f"[WARNING]: Error capturing frame for {sensor_name}: {e}")
+            if args_cli.video and video_encoders:
+                if record_stream is not None:
+                    # Wait for this step's render before reading the camera outputs
+                    sim_stream = torch.cuda.current_stream(device)
+                    record_stream.wait_stream(sim_stream)
+                record_slots = {}
+                with torch.cuda.stream(record_stream) if record_stream is not None else nullcontext():
+                    for sensor_name, sensor in list(recording_sensors):
+                        try:
+                            rgb = sensor.data.output['rgb'][0]
+
+                            # Convert to uint8 if needed (the readback copy does the cast)
+                            if rgb.is_floating_point():
+                                rgb = rgb.clamp(0, 1).mul_(255)
+
+                            # Queue the copy into a free ring slot; it is waited on next step
+                            slot = video_encoders[sensor_name].acquire()
+                            host_buffers[sensor_name][slot].copy_(rgb, non_blocking=True)
+                            if readback_events[sensor_name][slot] is not None:
+                                readback_events[sensor_name][slot].record()
+                            record_slots[sensor_name] = slot
+                        except Exception as e:
+                            stop_recording(sensor_name, e)
+                if record_stream is not None:
+                    # The next step re-renders into the same camera buffers, so the sim stream may not
+                    # run ahead of these reads; this is a device-side wait and does not block the host
+                    sim_stream.wait_stream(record_stream)
+
+                # Hand the previous step's frames to the encoders while this step's copies are in flight
+                if pending_slots is not None:
+                    encode_frames(pending_slots)
+                pending_slots = record_slots
             
             if args_cli.video and step_count % 50 == 0:
                 print(f"[INFO]: Recording... {step_count}/{args_cli.video_length} steps")
     
     # Release video writers
-    if args_cli.video and video_writers:
-        for sensor_name, writer in video_writers.items():
-            writer.release()
-            print(f"[INFO]: Saved {sensor_name}.mp4")
+    if args_cli.video and video_encoders:
+        if pending_slots is not None:
+            encode_frames(pending_slots)
+        close_recording(video_encoders, host_buffers, readback_events)
         print(f"[INFO]: Video recording complete! Check {video_dir}")
 
     # close the simulator
@@ -6,6 +6,25 @@
 """Configuration modules for G1 robot and cameras."""
 
 from .robot_config import G1_DEX3_43DOF_CFG
-from .camera_config import CameraPresets
+from .g1_robot_factory import ARM_HAND_JOINT_NAMES, EXPANDED_ARM_HAND_JOINT_NAMES, build_dex3_43dof
+from .sim_settings import common_sim_settings
+from .camera_config import (
+    G1_FRONT_CAMERA_CFG,
+    G1_WORLD_CAMERA_CFG,
+    LEFT_DEX3_WRIST_CAMERA_CFG,
+    RIGHT_DEX3_WRIST_CAMERA_CFG,
+    SKIP_CAMERA_OBS,
+)
 
-__all__ = ["G1_DEX3_43DOF_CFG", "CameraPresets"]
+__all__ = [
+    "G1_DEX3_43DOF_CFG",
+    "ARM_HAND_JOINT_NAMES",
+    "EXPANDED_ARM_HAND_JOINT_NAMES",
+    "build_dex3_43dof",
+    "common_sim_settings",
+    "G1_FRONT_CAMERA_CFG",
+    "G1_WORLD_CAMERA_CFG",
+    "LEFT_DEX3_WRIST_CAMERA_CFG",
+    "RIGHT_DEX3_WRIST_CAMERA_CFG",
+    "SKIP_CAMERA_OBS",
+]
@@ -0,0 +1,26 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Asset path helpers."""
+
+import os
+
+
+def prefer_instanceable(usd_path: str) -> str:
+    """Get the instanceable variant of a USD asset if one has been generated.
+
+    Instanceable variants (``<name>_instanceable.usd`` next to the original, written by
+    ``scripts/convert_instanceable.py``) author their meshes once as instance prototypes, so
+    environment clones share them instead of duplicating the geometry per environment.
+
+    Args:
+        usd_path: Path to the original USD file
+
+    Returns:
+        str: Path to the instanceable variant if it exists, otherwise ``usd_path``
+    """
+    root, ext = os.path.splitext(usd_path)
+    instanceable_path = f"{root}_instanceable{ext}"
+    return instanceable_path if os.path.isfile(instanceable_path) else usd_path
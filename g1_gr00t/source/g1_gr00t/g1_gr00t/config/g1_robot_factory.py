@@ -0,0 +1,123 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Task-side G1 Dex3 robot configuration shared by the manipulation environments."""
+
+import re
+
+import isaaclab.sim as sim_utils
+from isaaclab.assets.articulation import ArticulationCfg
+
+from .robot_config import G1_DEX3_43DOF_CFG
+
+# Joints driven by the GR00T policy (28 DOF total), as action joint name patterns
+ARM_HAND_JOINT_NAMES = (
+    # Arms (14 DOF)
+    ".*_shoulder_pitch_joint",
+    ".*_shoulder_roll_joint",
+    ".*_shoulder_yaw_joint",
+    ".*_elbow_joint",
+    ".*_wrist_yaw_joint",
+    ".*_wrist_roll_joint",
+    ".*_wrist_pitch_joint",
+    # Hands (14 DOF - Dex3)
+    ".*_hand_index_0_joint",
+    ".*_hand_middle_0_joint",
+    ".*_hand_thumb_0_joint",
+    ".*_hand_index_1_joint",
+    ".*_hand_middle_1_joint",
+    ".*_hand_thumb_1_joint",
+    ".*_hand_thumb_2_joint",
+)
+
+
+def _expand_joint_names(patterns: tuple[str, ...], joint_names: list[str]) -> list[str]:
+    """Match joint name patterns against known joint names, one pattern at a time."""
+    return [name for pattern in patterns for name in joint_names if re.fullmatch(pattern, name)]
+
+
+# The actuator groups of the robot list all of its joints by exact name
+_ROBOT_JOINT_NAMES = [
+    name for actuator in G1_DEX3_43DOF_CFG.actuators.values() for name in actuator.joint_names_expr
+]
+_expanded = _expand_joint_names(ARM_HAND_JOINT_NAMES, _ROBOT_JOINT_NAMES)
+# Two joints (left and right) per pattern, otherwise the actuator lists no longer name every joint
+_EXPAND_FAILED = len(set(_expanded)) != 2 * len(ARM_HAND_JOINT_NAMES)
+
+# ARM_HAND_JOINT_NAMES resolved at import to the 28 exact joint names, so the action term matches each
+# name against the articulation's joints once instead of trying 14 patterns per joint. Isaac Lab orders
+# the resolved joints by articulation index either way.
+EXPANDED_ARM_HAND_JOINT_NAMES = list(ARM_HAND_JOINT_NAMES) if _EXPAND_FAILED else _expanded
+
+
+def build_dex3_43dof(
+    init_pos: tuple[float, float, float],
+    init_rot: tuple[float, float, float, float],
+    extra_joint_pos: dict[str, float],
+) -> ArticulationCfg:
+    """Create the G1 Dex3 robot configuration used by the manipulation tasks.
+
+    The robot stands with its legs in the standing pose and both hands open, and its base is
+    fixed in place.
+
+    Args:
+        init_pos: Initial root position (x, y, z)
+        init_rot: Initial root rotation quaternion (w, x, y, z)
+        extra_joint_pos: Initial positions of the remaining joints (the arm pose of the task)
+
+    Returns:
+        ArticulationCfg: Robot configuration spawned at ``/World/envs/env_.*/Robot``
+    """
+    return G1_DEX3_43DOF_CFG.replace(
+        prim_path="/World/envs/env_.*/Robot",
+        init_state=ArticulationCfg.InitialStateCfg(
+            pos=init_pos,
+            rot=init_rot,
+            joint_pos={
+                # Leg joints - standing pose (locked)
+                ".*_hip_pitch_joint": -0.20,
+                ".*_knee_joint": 0.42,
+                ".*_ankle_pitch_joint": -0.23,
+
+                **extra_joint_pos,
+
+                # Hand joints (Dex3) - neutral/open pose
+                "left_hand_index_0_joint": 0.0,
+                "left_hand_middle_0_joint": 0.0,
+                "left_hand_thumb_0_joint": 0.0,
+                "left_hand_index_1_joint": 0.0,
+                "left_hand_middle_1_joint": 0.0,
+                "left_hand_thumb_1_joint": 0.0,
+                "left_hand_thumb_2_joint": 0.0,
+
+                "right_hand_index_0_joint": 0.0,
+                "right_hand_middle_0_joint": 0.0,
+                "right_hand_thumb_0_joint": 0.0,
+                "right_hand_index_1_joint": 0.0,
+                "right_hand_middle_1_joint": 0.0,
+                "right_hand_thumb_1_joint": 0.0,
+                "right_hand_thumb_2_joint": 0.0,
+            },
+            joint_vel={".*": 0.0},
+        ),
+        # Lock the base and legs by making them kinematic
+        spawn=G1_DEX3_43DOF_CFG.spawn.replace(
+            rigid_props=sim_utils.RigidBodyPropertiesCfg(
+                disable_gravity=False,
+                retain_accelerations=False,
+                linear_damping=0.0,
+                angular_damping=0.0,
+                max_linear_velocity=1000.0,
+                max_angular_velocity=1000.0,
+                max_depenetration_velocity=1.0,
+            ),
+            articulation_props=sim_utils.ArticulationRootPropertiesCfg(
+                enabled_self_collisions=False,
+                solver_position_iteration_count=4,
+                solver_velocity_iteration_count=1,
+                fix_root_link=True,  # Lock the base in place
+            ),
+        ),
+    )
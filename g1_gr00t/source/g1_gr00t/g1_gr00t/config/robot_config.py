@@ -11,6 +11,8 @@ from isaaclab.actuators import ImplicitActuatorCfg
 from isaaclab.assets.articulation import ArticulationCfg
 from isaaclab.utils import configclass
 
+from .assets import prefer_instanceable
+
 # Get the project root directory
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -32,7 +34,9 @@ class G1Dex3WholebodyConfig:
 
 G1_DEX3_43DOF_CFG = ArticulationCfg(
     spawn=sim_utils.UsdFileCfg(
-        usd_path=f"{PROJECT_ROOT}/assets/robots/g1-29dof_wholebody_dex3/g1_29dof_with_dex3_rev_1_0.usd",
+        usd_path=prefer_instanceable(
+            f"{PROJECT_ROOT}/assets/robots/g1-29dof_wholebody_dex3/g1_29dof_with_dex3_rev_1_0.usd"
+        ),
         activate_contact_sensors=True,
         rigid_props=sim_utils.RigidBodyPropertiesCfg(
             disable_gravity=False,
@@ -84,15 +88,19 @@ G1_DEX3_43DOF_CFG = ArticulationCfg(
         joint_vel={".*": 0.0},
     ),
     soft_joint_pos_limit_factor=0.90,
+    # Actuator groups list their joints by exact name (43 in total), so resolving them at env build
+    # needs no pattern matching over the articulation's joints
     actuators={
-        # Legs and waist - LOCKED with very high stiffness to prevent movement
-        "legs": ImplicitActuatorCfg(
+        # Legs, waist and feet - LOCKED with very high stiffness to prevent movement
+        "locked": ImplicitActuatorCfg(
             joint_names_expr=[
-                ".*_hip_yaw_joint",
-                ".*_hip_roll_joint",
-                ".*_hip_pitch_joint",
-                ".*_knee_joint",
-                ".*waist.*",
+                "left_hip_yaw_joint", "right_hip_yaw_joint",
+                "left_hip_roll_joint", "right_hip_roll_joint",
+                "left_hip_pitch_joint", "right_hip_pitch_joint",
+                "left_knee_joint", "right_knee_joint",
+                "waist_yaw_joint", "waist_roll_joint", "waist_pitch_joint",
+                "left_ankle_pitch_joint", "right_ankle_pitch_joint",
+                "left_ankle_roll_joint", "right_ankle_roll_joint",
             ],
             effort_limit_sim={
                 ".*_hip_yaw_joint": 88.0,
@@ -102,52 +110,19 @@ G1_DEX3_43DOF_CFG = ArticulationCfg(
                 ".*waist_yaw_joint": 88.0,
                 ".*waist_roll_joint": 35.0,
                 ".*waist_pitch_joint": 35.0,
-            },
-            velocity_limit_sim={
-                ".*_hip_yaw_joint": 0.01,  # Nearly zero velocity
-                ".*_hip_roll_joint": 0.01,
-                ".*_hip_pitch_joint": 0.01,
-                ".*_knee_joint": 0.01,
-                ".*waist_yaw_joint": 0.01,
-                ".*waist_roll_joint": 0.01,
-                ".*waist_pitch_joint": 0.01,
-            },
-            stiffness={
-                ".*_hip_yaw_joint": 10000.0,  # Very high stiffness to lock
-                ".*_hip_roll_joint": 10000.0,
-                ".*_hip_pitch_joint": 10000.0,
-                ".*_knee_joint": 10000.0,
-                ".*waist.*": 10000.0,
-            },
-            damping={
-                ".*_hip_yaw_joint": 1000.0,  # High damping to prevent oscillation
-                ".*_hip_roll_joint": 1000.0,
-                ".*_hip_pitch_joint": 1000.0,
-                ".*_knee_joint": 1000.0,
-                ".*waist.*": 1000.0,
-            },
-            armature=0.01,
-        ),
-        # Feet - LOCKED
-        "feet": ImplicitActuatorCfg(
-            joint_names_expr=[".*_ankle_pitch_joint", ".*_ankle_roll_joint"],
-            effort_limit_sim={
                 ".*_ankle_pitch_joint": 35.0,
                 ".*_ankle_roll_joint": 35.0,
             },
-            velocity_limit_sim={
-                ".*_ankle_pitch_joint": 0.01,
-                ".*_ankle_roll_joint": 0.01,
-            },
+            velocity_limit_sim={".*": 0.01},  # Nearly zero velocity
             stiffness=10000.0,  # Very high stiffness to lock
-            damping=1000.0,  # High damping
+            damping=1000.0,  # High damping to prevent oscillation
             armature=0.01,
         ),
         # Shoulders
         "shoulders": ImplicitActuatorCfg(
             joint_names_expr=[
-                ".*_shoulder_pitch_joint",
-                ".*_shoulder_roll_joint",
+                "left_shoulder_pitch_joint", "right_shoulder_pitch_joint",
+                "left_shoulder_roll_joint", "right_shoulder_roll_joint",
             ],
             effort_limit_sim={
                 ".*_shoulder_pitch_joint": 25.0,
@@ -164,8 +139,8 @@ G1_DEX3_43DOF_CFG = ArticulationCfg(
         # Arms (shoulder yaw and elbow)
         "arms": ImplicitActuatorCfg(
             joint_names_expr=[
-                ".*_shoulder_yaw_joint",
-                ".*_elbow_joint",
+                "left_shoulder_yaw_joint", "right_shoulder_yaw_joint",
+                "left_elbow_joint", "right_elbow_joint",
             ],
             effort_limit_sim={
                 ".*_shoulder_yaw_joint": 25.0,
@@ -182,7 +157,9 @@ G1_DEX3_43DOF_CFG = ArticulationCfg(
         # Wrists
         "wrist": ImplicitActuatorCfg(
             joint_names_expr=[
-                ".*_wrist_.*",
+                "left_wrist_roll_joint", "right_wrist_roll_joint",
+                "left_wrist_pitch_joint", "right_wrist_pitch_joint",
+                "left_wrist_yaw_joint", "right_wrist_yaw_joint",
             ],
             effort_limit_sim={
                 ".*_wrist_yaw_joint": 5.0,
@@ -201,9 +178,13 @@ G1_DEX3_43DOF_CFG = ArticulationCfg(
         # Hands (Dex3 - 7 DOF per hand)
         "hands": ImplicitActuatorCfg(
             joint_names_expr=[
-                ".*_hand_index_.*_joint",
-                ".*_hand_middle_.*_joint",
-                ".*_hand_thumb_.*_joint",
+                "left_hand_index_0_joint", "right_hand_index_0_joint",
+                "left_hand_index_1_joint", "right_hand_index_1_joint",
+                "left_hand_middle_0_joint", "right_hand_middle_0_joint",
+                "left_hand_middle_1_joint", "right_hand_middle_1_joint",
+                "left_hand_thumb_0_joint", "right_hand_thumb_0_joint",
+                "left_hand_thumb_1_joint", "right_hand_thumb_1_joint",
+                "left_hand_thumb_2_joint", "right_hand_thumb_2_joint",
             ],
             effort_limit=300,
             velocity_limit=100.0,
@@ -0,0 +1,31 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Simulation settings shared by the manipulation environments."""
+
+from isaaclab.envs import ManagerBasedRLEnvCfg
+
+
+def common_sim_settings(cfg: ManagerBasedRLEnvCfg):
+    """Apply the simulation, PhysX and physics material settings of the G1 tasks.
+
+    Called from the environment ``__post_init__`` after ``decimation`` is set.
+
+    Args:
+        cfg: Environment configuration to modify in place
+    """
+    # Simulation settings
+    cfg.sim.dt = 0.005
+    cfg.sim.render_interval = cfg.decimation
+    cfg.sim.physx.bounce_threshold_velocity = 0.01
+    cfg.sim.physx.gpu_found_lost_aggregate_pairs_capacity = 1024 * 1024 * 4
+    cfg.sim.physx.gpu_total_aggregate_pairs_capacity = 16 * 1024
+    cfg.sim.physx.friction_correlation_distance = 0.00625
+
+    # Physics material properties
+    cfg.sim.physics_material.static_friction = 1.0
+    cfg.sim.physics_material.dynamic_friction = 1.0
+    cfg.sim.physics_material.friction_combine_mode = "max"
+    cfg.sim.physics_material.restitution_combine_mode = "max"
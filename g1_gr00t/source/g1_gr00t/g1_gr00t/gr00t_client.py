@@ -0,0 +1,547 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""GR00T N1.5 client for G1 robot control."""
+
+import torch
+import numpy as np
+import zmq
+import msgpack
+import io
+import logging
+import orjson
+import struct
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+
+class _RateLimitFilter(logging.Filter):
+    """Drop repeats of a message logged with ``extra={"rate_limited": True}`` within ``interval`` seconds."""
+    
+    def __init__(self, interval: float = 5.0):
+        super().__init__()
+        self.interval = interval
+        self._last_emitted: Dict[str, float] = {}
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "rate_limited", False):
+            return True
+        # Keyed on the formatted message: different errors logged through one template are not repeats
+        message = record.getMessage()
+        last = self._last_emitted.get(message)
+        if last is not None and record.created - last < self.interval:
+            return False
+        # Entries are kept in emission order; the ones older than `interval` no longer suppress
+        # anything, so they are dropped to keep distinct messages from accumulating
+        self._last_emitted.pop(message, None)
+        self._last_emitted[message] = record.created
+        expired = record.created - self.interval
+        while self._last_emitted and next(iter(self._last_emitted.values())) <= expired:
+            del self._last_emitted[next(iter(self._last_emitted))]
+        return True
+
+
+logger = logging.getLogger(__name__)
+logger.addFilter(_RateLimitFilter())
+
+# Arrays are serialized natively instead of through .tolist()
+_LOG_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+# Columns of each arm/hand in the 28-DOF action space
+_ACTION_PARTS = {
+    'left_arm': slice(0, 7),
+    'right_arm': slice(7, 14),
+    'left_hand': slice(14, 21),
+    'right_hand': slice(21, 28),
+}
+
+# Flat binary get_action messages (protocol="flat"), decoded by the logging inference server.
+# 0xc1 is never used by msgpack, so replies in either format can be told apart.
+#   request: 0xc1 | u32 height | u32 width | uint8 image (H, W, 3) | float64 states (4, 7)
+#            | u16 task description length | utf-8 task description
+#   reply:   0xc1 | u32 n_timesteps | float32 actions (n_timesteps, 28)
+# States and actions are little-endian, in left_arm, right_arm, left_hand, right_hand order.
+_FLAT_MAGIC = b"\xc1"
+
+
+def _unpack_flat_actions(message: memoryview) -> np.ndarray:
+    """Decode a flat get_action reply into (n_timesteps, 28) float32 actions."""
+    if message[:1] != _FLAT_MAGIC:
+        raise ValueError("Not a flat get_action reply")
+    (n_timesteps,) = struct.unpack_from("<I", message, 1)
+    actions = np.frombuffer(message, dtype="<f4", count=n_timesteps * 28, offset=5)
+    # Copied out of the message: a writable array in native byte order
+    return actions.reshape(n_timesteps, 28).astype(np.float32)
+
+
+class MsgSerializer:
+    """Message serializer compatible with GR00T server."""
+    
+    @staticmethod
+    def to_bytes(data: dict) -> bytes:
+        return msgpack.packb(data, default=MsgSerializer.encode_custom_classes)
+    
+    @staticmethod
+    def from_bytes(data: bytes) -> dict:
+        return msgpack.unpackb(data, object_hook=MsgSerializer.decode_custom_classes)
+    
+    @staticmethod
+    def decode_custom_classes(obj):
+        if "__nd__" in obj:
+            # Read-only view of the received bytes, no NPY header to parse
+            obj = np.frombuffer(obj["b"], dtype=np.dtype(obj["t"])).reshape(obj["s"])
+        elif "__ndarray_class__" in obj:
+            # Servers still sending NPY payloads
+            obj = np.load(io.BytesIO(obj["as_npy"]), allow_pickle=False)
+        return obj
+    
+    @staticmethod
+    def encode_custom_classes(obj):
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.hasobject:
+                raise ValueError("Object arrays cannot be serialized")
+            # Raw C-order bytes plus shape and dtype: a single copy instead of an NPY file
+            return {"__nd__": True, "s": obj.shape, "t": obj.dtype.str, "b": obj.tobytes()}
+        return obj
+
+
+class GR00TClient:
+    """Client to communicate with GR00T N1.5 inference server via ZMQ.
+    
+    GR00T expects:
+    - video.rs_view: (H, W, 3) uint8 image
+    - state.left_arm: 7 joint values (shoulder_pitch, shoulder_roll, shoulder_yaw, elbow, wrist_roll, wrist_pitch, wrist_yaw)
+    - state.right_arm: 7 joint values
+    - state.left_hand: 7 Dex3 hand joint values
+    - state.right_hand: 7 Dex3 hand joint values
+    - annotation.human.task_description: text string
+    
+    GR00T returns:
+    - action.left_arm: (n_timesteps, 7)
+    - action.right_arm: (n_timesteps, 7)
+    - action.left_hand: (n_timesteps, 7)
+    - action.right_hand: (n_timesteps, 7)
+    
+    With ``prefetch_margin > 0``, the next action chunk is requested on a background thread once
+    only ``prefetch_margin`` cached actions remain, so inference overlaps with executing them.
+    The new chunk is predicted from an older observation, so the actions for steps that have
+    already been executed since are skipped.
+    
+    With ``protocol="flat"``, get_action requests and replies use a fixed binary layout instead of
+    msgpack (see ``_FLAT_MAGIC``). This needs the logging inference server
+    (``scripts/inference_service_g1.py``) and does not send an API token.
+    """
+    
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 5555,
+        n_timesteps: int = 16,
+        task_description: str = "pick up the cylinder",
+        log_dir: Optional[Path] = None,
+        prefetch_margin: int = 0,
+        protocol: str = "msgpack",
+    ):
+        if protocol not in ("msgpack", "flat"):
+            raise ValueError(f"Unknown protocol: {protocol}")
+        self.host = host
+        self.port = port
+        self.n_timesteps = n_timesteps
+        self.task_description = task_description
+        self.prefetch_margin = prefetch_margin
+        self.protocol = protocol
+        self._connected = False
+        self._socket = None
+        self._context = None
+        self._request_id = 0
+        self._action_queue = np.empty((0, 28), dtype=np.float32)  # Predicted actions, one row per timestep
+        self._current_timestep = 0
+        self._step_count = 0
+        
+        # In-flight request for the next action chunk and the step its observation was taken at
+        self._executor = ThreadPoolExecutor(max_workers=1) if prefetch_margin > 0 else None
+        self._pending: Optional[Future] = None
+        self._pending_step = 0
+        
+        # Set up logging
+        self.log_dir = log_dir
+        self.log_file = None
+        if log_dir:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self.log_file = log_dir / "client_actions.jsonl"
+            logger.info("[CLIENT LOG] Logging to %s", self.log_file)
+        
+        # Joint indices for our 43 DOF robot (from modality.json)
+        # state indices: [0-6: left_leg, 6-12: right_leg, 12-15: waist, 
+        #                 15-22: left_arm, 22-29: left_hand, 29-36: right_arm, 36-43: right_hand]
+        self.left_arm_indices = list(range(15, 22))    # 7 joints
+        self.right_arm_indices = list(range(29, 36))   # 7 joints
+        self.left_hand_indices = list(range(22, 29))   # 7 joints
+        self.right_hand_indices = list(range(36, 43))  # 7 joints
+        # The four groups gathered with a single index_select; packed state slices per group
+        self._state_perm = np.asarray(
+            self.left_arm_indices + self.right_arm_indices + self.left_hand_indices + self.right_hand_indices,
+            dtype=np.int64,
+        )
+        self._state_slices = {
+            'state.left_arm': slice(0, 7),
+            'state.right_arm': slice(7, 14),
+            'state.left_hand': slice(14, 21),
+            'state.right_hand': slice(21, 28),
+        }
+        self._task_descriptions = [task_description]
+        # Gather indices on the observation device (uploaded on the first observation)
+        self._state_perm_t: Optional[torch.Tensor] = None
+        # Float64 state buffer reused by every observation (pinned once observations come from the GPU);
+        # like the image buffer below, it is only rewritten by the next request's observation, after
+        # this one has been serialized
+        self._packed_state_t = torch.empty((1, 28), dtype=torch.float64)
+        self._packed_state = self._packed_state_t.numpy()
+        task_bytes = task_description.encode("utf-8")
+        self._flat_task = struct.pack("<H", len(task_bytes)) + task_bytes
+        
+        # Host copy of the camera image sent with each request (allocated on the first image). It is
+        # only rewritten by the next request's observation, after this one has been serialized.
+        self._image_host: Optional[torch.Tensor] = None
+        self._copy_stream: Optional[torch.cuda.Stream] = None
+        # Front camera sensor, looked up again only when a different environment is passed in
+        self._front_cam = None
+        self._front_cam_env = None
+        
+        # Returned when no action can be obtained; callers copy actions out rather than modifying them
+        self._zero_action = torch.zeros(28, dtype=torch.float32)
+        # Sent when the camera is not available; only ever read
+        self._blank_image = np.zeros((480, 640, 3), dtype=np.uint8)
+        self._warned_blank_image = False
+
+    def connect(self):
+        """Connect to GR00T server via ZMQ."""
+        try:
+            # Process-wide context: reconnecting doesn't start new IO threads
+            self._context = zmq.Context.instance()
+            # DEALER rather than REQ: a timed-out request doesn't leave the socket unable to send, and
+            # each request carries an id (echoed back in the reply envelope) so late replies are dropped
+            self._socket = self._context.socket(zmq.DEALER)
+            self._socket.setsockopt(zmq.LINGER, 0)
+            self._socket.connect(f"tcp://{self.host}:{self.port}")
+            self._socket.setsockopt(zmq.RCVTIMEO, 10000)  # 10 second timeout
+            self._connected = True
+            logger.info("[GR00T] Connected to server at %s:%d", self.host, self.port)
+        except Exception as e:
+            logger.error("[GR00T] Failed to connect: %s", e)
+            self._connected = False
+
+    def disconnect(self):
+        """Disconnect from GR00T server."""
+        if self._executor:
+            self._executor.shutdown(wait=True)
+        if self._socket:
+            self._socket.close()
+        # The shared context is left to the process; terminating it would close other users' sockets
+        self._context = None
+        self._connected = False
+        logger.info("[GR00T] Disconnected from server")
+
+    def _prepare_observation(self, obs: Dict[str, torch.Tensor], env) -> Dict[str, np.ndarray]:
+        """Convert Isaac Lab observation to GR00T format.
+        
+        Args:
+            obs: Observation dict from Isaac Lab with keys 'robot_body_state', 'robot_hand_state'
+            env: Environment instance (to access cameras)
+            
+        Returns:
+            Dict in GR00T format
+        """
+        # Get camera image from front_camera. Its readback is queued first, on a separate stream, so
+        # it runs while the joint states are copied and packed below.
+        image = None
+        image_copied = None
+        try:
+            if env is not self._front_cam_env:
+                self._front_cam_env = env
+                self._front_cam = None
+                if hasattr(env.unwrapped.scene, 'sensors'):
+                    front_cam = env.unwrapped.scene.sensors.get('front_camera')
+                    if front_cam and hasattr(front_cam, 'data'):
+                        self._front_cam = front_cam
+            if self._front_cam is not None:
+                rgb_data = self._front_cam.data.output.get('rgb')
+                if rgb_data is not None:
+                    # Convert to uint8 on the device so only uint8 pixels are copied to the host
+                    rgb = rgb_data[0]  # (H, W, 3)
+                    if rgb.dtype != torch.uint8:
+                        rgb = rgb.mul(255).clamp_(0, 255).to(torch.uint8)
+                    # Copied into a buffer reused across calls (pinned for GPU frames) rather than new
+                    # memory. CPU frames are copied too: the camera buffer is overwritten by the next
+                    # env.step while a prefetched request may still be serializing the image.
+                    if (
+                        self._image_host is None
+                        or self._image_host.shape != rgb.shape
+                        or (rgb.is_cuda and not self._image_host.is_pinned())
+                    ):
+                        self._image_host = torch.empty(rgb.shape, dtype=torch.uint8, pin_memory=rgb.is_cuda)
+                    if rgb.is_cuda:
+                        if self._copy_stream is None:
+                            self._copy_stream = torch.cuda.Stream(device=rgb.device)
+                        self._copy_stream.wait_stream(torch.cuda.current_stream(rgb.device))
+                        with torch.cuda.stream(self._copy_stream):
+                            self._image_host.copy_(rgb, non_blocking=True)
+                            image_copied = torch.cuda.Event()
+                            image_copied.record()
+                        # The uint8 conversion was allocated on the current stream
+                        rgb.record_stream(self._copy_stream)
+                    else:
+                        self._image_host.copy_(rgb)
+                    image = self._image_host.numpy()
+        except Exception as e:
+            logger.warning("[GR00T] Could not get camera image: %s", e, extra={"rate_limited": True})
+        
+        # Get joint states
+        # body_state: (87,) = [positions(29), velocities(29), torques(29)] - BLOCK CONCATENATED
+        # hand_state: (42,) = [positions(14), velocities(14), torques(14)] - BLOCK CONCATENATED
+        body_state = obs['robot_body_state'][0]  # (87,)
+        hand_state = obs['robot_hand_state'][0]  # (42,)
+        
+        # Extract positions only (first N values, NOT every 3rd!) and combine them into the full
+        # 43 DOF state, on the observation device
+        full_state = torch.cat((body_state[:29], hand_state[:14]))
+        
+        # Extract arm and hand states in one gather, so only the 28 values used are copied to the host,
+        # widened to float64 (numpy has no bfloat16) into the reused (1, 28) output:
+        # [left_arm(7), right_arm(7), left_hand(7), right_hand(7)]
+        if self._state_perm_t is None or self._state_perm_t.device != full_state.device:
+            self._state_perm_t = torch.from_numpy(self._state_perm).to(full_state.device)
+        state = full_state.index_select(0, self._state_perm_t).to(torch.float64)
+        state_copied = None
+        if state.is_cuda:
+            # Queued behind the image on the copy stream, so both copies are in flight before either
+            # is waited on
+            if not self._packed_state_t.is_pinned():
+                self._packed_state_t = torch.empty((1, 28), dtype=torch.float64, pin_memory=True)
+                self._packed_state = self._packed_state_t.numpy()
+            if self._copy_stream is None:
+                self._copy_stream = torch.cuda.Stream(device=state.device)
+            self._copy_stream.wait_stream(torch.cuda.current_stream(state.device))
+            with torch.cuda.stream(self._copy_stream):
+                self._packed_state_t[0].copy_(state, non_blocking=True)
+                state_copied = torch.cuda.Event()
+                state_copied.record()
+            state.record_stream(self._copy_stream)
+        else:
+            self._packed_state_t[0].copy_(state)
+        packed_state = self._packed_state
+        
+        # The state copy was queued after the image copy on the same stream, so waiting for it covers both
+        if state_copied is not None:
+            state_copied.synchronize()
+        elif image_copied is not None:
+            image_copied.synchronize()
+        
+        # Fallback to a blank image if camera not available
+        if image is None:
+            if not self._warned_blank_image:
+                logger.warning("[GR00T] No camera image available, sending blank images")
+                self._warned_blank_image = True
+            image = self._blank_image
+        
+        groot_obs = {'video.rs_view': image[np.newaxis, ...]}  # Add batch dimension
+        for key, state_slice in self._state_slices.items():
+            groot_obs[key] = packed_state[:, state_slice]
+        groot_obs['annotation.human.task_description'] = self._task_descriptions
+        return groot_obs
+
+    def get_action(self, obs: Dict[str, torch.Tensor], env) -> torch.Tensor:
+        """Get action from GR00T server.
+        
+        Args:
+            obs: Observation dict from Isaac Lab
+            env: Environment instance (to access cameras)
+            
+        Returns:
+            Action tensor (28 DOF: 14 arm + 14 hand joint positions)
+        """
+        self._step_count += 1
+        
+        if not self._connected:
+            logger.warning("[GR00T] Not connected. Returning zero actions.", extra={"rate_limited": True})
+            return self._zero_action
+        
+        try:
+            new_chunk = self._current_timestep >= len(self._action_queue)
+            if new_chunk and self._pending is not None:
+                # Use the prefetched chunk, skipping actions for steps executed since its observation
+                pending, self._pending = self._pending, None
+                self._set_action_queue(pending.result(), skip=self._step_count - self._pending_step)
+            elif new_chunk:
+                # Need to query GR00T for new actions
+                self._set_action_queue(self._query_actions(self._prepare_observation(obs, env), self._step_count))
+            
+            action = self._action_queue[self._current_timestep]
+            self._current_timestep += 1
+            
+            # Log the action being returned
+            if self.log_file:
+                log_entry = {
+                    "step": self._step_count,
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "action_returned" if new_chunk else "cached_action",
+                    "queue_index": self._current_timestep - 1,
+                    "action": action
+                }
+                with open(self.log_file, 'ab') as f:
+                    f.write(orjson.dumps(log_entry, option=_LOG_OPTIONS))
+            
+            # Start fetching the next chunk while the remaining actions execute
+            remaining = len(self._action_queue) - self._current_timestep
+            if self._executor and self._pending is None and remaining <= self.prefetch_margin:
+                self._pending_step = self._step_count
+                self._pending = self._executor.submit(
+                    self._query_actions, self._prepare_observation(obs, env), self._step_count
+                )
+            
+            # float32 row of the action chunk, shared rather than copied
+            return torch.from_numpy(action)
+            
+        except zmq.error.Again:
+            logger.warning("[GR00T] Request timeout", extra={"rate_limited": True})
+            return self._zero_action
+        except Exception as e:
+            logger.exception("[GR00T] Error getting action: %s", e)
+            return self._zero_action
+
+    def _set_action_queue(self, actions: np.ndarray, skip: int = 0):
+        """Replace the cached actions, starting from ``actions[skip]`` (the last action at most)."""
+        self._action_queue = actions
+        self._current_timestep = min(skip, len(actions) - 1)
+        logger.debug("[GR00T] Received %d timesteps of actions", len(actions))
+
+    def _query_actions(self, groot_obs: Dict[str, Any], step: int) -> np.ndarray:
+        """Send one observation to the server and return its action chunk as (n_timesteps, 28) actions.
+        
+        Runs on the prefetch thread as well, so the step of the observation is passed in rather than
+        read from the client.
+        """
+        # Log observation sent to server
+        if self.log_file:
+            obs_log = {
+                "step": step,
+                "timestamp": datetime.now().isoformat(),
+                "type": "observation_sent",
+                "observation": {}
+            }
+            for key, value in groot_obs.items():
+                if isinstance(value, np.ndarray):
+                    obs_log["observation"][key] = {
+                        "shape": value.shape,
+                        "dtype": str(value.dtype),
+                        "min": float(np.min(value)),
+                        "max": float(np.max(value)),
+                        "mean": float(np.mean(value)),
+                        "data": value
+                    }
+                else:
+                    obs_log["observation"][key] = value
+            with open(self.log_file, 'ab') as f:
+                f.write(orjson.dumps(obs_log, option=_LOG_OPTIONS))
+        
+        # Prepare request in GR00T format
+        if self.protocol == "flat":
+            payload = self._pack_flat_observation(groot_obs)
+        else:
+            request = {
+                "endpoint": "get_action",
+                "data": groot_obs
+            }
+            payload = MsgSerializer.to_bytes(request)
+        
+        # Send to server: [request id, empty delimiter, payload], as REQ would frame it plus the id.
+        # Not copied into zmq: the payload is immutable bytes, so zmq can hold a reference to it until
+        # it has been sent without a tracker.
+        self._request_id += 1
+        request_id = self._request_id.to_bytes(8, "little")
+        self._socket.send_multipart([request_id, b"", payload], copy=False)
+        
+        # Receive response, skipping replies to earlier requests that timed out. The reply is decoded
+        # straight out of the zmq message rather than from a bytes copy of it.
+        while True:
+            frames = self._socket.recv_multipart(copy=False)
+            if frames[0].bytes == request_id:
+                break
+        message = frames[-1].buffer
+        
+        if message[:1] == _FLAT_MAGIC:
+            # (n_timesteps, 28) actions, already in action space order
+            actions = _unpack_flat_actions(message)
+            action_parts = {name: actions[:, part] for name, part in _ACTION_PARTS.items()}
+        else:
+            response = MsgSerializer.from_bytes(message)
+            
+            # Check for error (also sent as msgpack in reply to flat requests)
+            if "error" in response:
+                raise RuntimeError(f"Server error: {response['error']}")
+            
+            # Extract actions: (n_timesteps, 7) for each part
+            action_parts = {name: response[f'action.{name}'] for name in _ACTION_PARTS}
+            
+            # Reconstruct 28 DOF actions for all timesteps at once (arms and hands only)
+            # Action space order: left_arm(7), right_arm(7), left_hand(7), right_hand(7)
+            actions = np.concatenate(list(action_parts.values()), axis=1, dtype=np.float32)  # (n_timesteps, 28)
+        
+        # Log received actions from server
+        if self.log_file:
+            recv_log = {
+                "step": step,
+                "timestamp": datetime.now().isoformat(),
+                "type": "actions_received",
+                # Column slices of flat replies are copied, orjson only serializes contiguous arrays
+                "actions": {name: np.ascontiguousarray(part) for name, part in action_parts.items()},
+            }
+            with open(self.log_file, 'ab') as f:
+                f.write(orjson.dumps(recv_log, option=_LOG_OPTIONS))
+        
+        return actions
+
+    def _pack_flat_observation(self, groot_obs: Dict[str, Any]) -> bytes:
+        """Encode a GR00T observation as a flat get_action request."""
+        image = np.ascontiguousarray(groot_obs['video.rs_view'][0])  # (H, W, 3) uint8
+        height, width = image.shape[:2]
+        states = np.concatenate([groot_obs[key] for key in self._state_slices], axis=1).astype("<f8", copy=False)
+        return b"".join((_FLAT_MAGIC, struct.pack("<II", height, width), image.data, states.data, self._flat_task))
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+
+def create_groot_client(
+    host: str = "localhost",
+    port: int = 5555,
+    task_description: str = "pick up the cylinder",
+    log_dir: Optional[Path] = None,
+    prefetch_margin: int = 0,
+    protocol: str = "msgpack",
+) -> GR00TClient:
+    """Factory function to create GR00T client.
+    
+    Args:
+        host: GR00T server host
+        port: GR00T server port
+        task_description: Task description for the robot
+        log_dir: Directory to save logs
+        prefetch_margin: Request the next action chunk in the background once this many
+            cached actions remain (0 requests synchronously when the cache runs out)
+        protocol: "msgpack", or "flat" for the fixed binary get_action layout (logging inference server only)
+    
+    Returns:
+        GR00TClient: Client instance (not yet connected)
+    """
+    return GR00TClient(
+        host=host,
+        port=port,
+        task_description=task_description,
+        log_dir=log_dir,
+        prefetch_margin=prefetch_margin,
+        protocol=protocol,
+    )
@@ -10,6 +10,8 @@ from __future__ import annotations
 import torch
 from typing import TYPE_CHECKING
 
+from .env_cache import get_env_cache
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -19,6 +21,8 @@ def get_camera_images(env: ManagerBasedRLEnv) -> torch.Tensor:
     
     This is a placeholder that returns a dummy tensor for now.
     Camera data can be accessed directly from env.scene.sensors when needed.
+    The placeholder does not depend on the camera sensors, so it is also valid when they are
+    skipped (G1_SKIP_CAMERA_OBS=1).
     
     Args:
         env: The RL environment
@@ -28,5 +32,10 @@ def get_camera_images(env: ManagerBasedRLEnv) -> torch.Tensor:
     """
     # Return a placeholder tensor so the observation manager is happy
     # Real camera data is accessible via env.scene.sensors["camera_name"].data.output["rgb"]
-    return torch.zeros(env.num_envs, 1, device=env.device)
+    # The same zeros are returned every step instead of allocating new ones; they are only ever read
+    cache = get_env_cache(env)
+    placeholder = cache.get("camera_placeholder")
+    if placeholder is None:
+        placeholder = cache["camera_placeholder"] = torch.zeros(env.num_envs, 1, device=env.device)
+    return placeholder
 
@@ -0,0 +1,37 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Per-environment state shared by the observation functions."""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+# Environment -> cached state; entries go away with their environment
+_env_cache: weakref.WeakKeyDictionary[ManagerBasedRLEnv, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def get_env_cache(env: ManagerBasedRLEnv) -> dict[str, Any]:
+    """Get the observation cache of an environment, created on first use.
+
+    The scene does not change once the environment is built, so lookups such as the robot
+    articulation, joint index tensors and reused output buffers are resolved once and stored here.
+    The observation manager calls every term once while it is constructed (to get the term shapes),
+    so all entries already exist before the first reset and no step allocates them.
+
+    Args:
+        env: The RL environment
+
+    Returns:
+        dict: Cache with the robot articulation under "robot"; observation functions add their own entries
+    """
+    cache = _env_cache.get(env)
+    if cache is None:
+        cache = _env_cache[env] = {"robot": env.scene["robot"]}
+    return cache
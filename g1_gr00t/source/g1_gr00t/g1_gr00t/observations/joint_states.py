@@ -0,0 +1,141 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Fused body + hand joint state gather shared by the body and hand observation terms."""
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+from .env_cache import get_env_cache
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+# Articulation indices of the body joints (29 DOF, excluding hands)
+# Order: left_leg(6), right_leg(6), waist(3), left_arm(7), right_arm(7)
+BODY_JOINT_INDICES = (
+    0, 3, 6, 9, 13, 17,  # left leg: hip_pitch, hip_roll, hip_yaw, knee, ankle_pitch, ankle_roll
+    1, 4, 7, 10, 14, 18,  # right leg: same order
+    2, 5, 8,  # waist: yaw, roll, pitch
+    11, 15, 19, 21, 23, 25, 27,  # left arm: shoulder_pitch, shoulder_roll, shoulder_yaw, elbow, wrist_roll, wrist_pitch, wrist_yaw
+    12, 16, 20, 22, 24, 26, 28,  # right arm: same order
+)
+
+# Articulation indices of the hand joints (14 DOF)
+# Order matches GR00T dataset: left hand (7) then right hand (7)
+HAND_JOINT_INDICES = (
+    31, 37, 41,  # left: thumb_0, thumb_1, thumb_2
+    30, 36,      # left: middle_0, middle_1
+    29, 35,      # left: index_0, index_1
+    34, 40, 42,  # right: thumb_0, thumb_1, thumb_2
+    33, 39,      # right: middle_0, middle_1
+    32, 38,      # right: index_0, index_1
+)
+
+# Return joint states as bfloat16, halving the bytes copied off the device. Off by default: the GR00T
+# policy was trained on float32 states and bfloat16 keeps only ~3 significant digits of a joint position.
+USE_BF16_OBS = False
+
+# Fuse the concatenation and the index_select into one generated kernel with torch.compile. Off by default:
+# the first step then pays for compilation (and needs Triton on GPU) to save one small kernel launch per step.
+COMPILE_GATHER = False
+
+# Include applied torques after positions and velocities. The GR00T clients only read joint positions;
+# without torques a third less is gathered per step, but the terms become [batch, 58] and [batch, 28].
+INCLUDE_TORQUE = True
+
+
+def get_joint_states(env: ManagerBasedRLEnv) -> tuple[torch.Tensor, torch.Tensor]:
+    """Gather the body and hand joint states in a single pass.
+
+    Positions, velocities and torques of all joints are concatenated once and the body and hand
+    blocks are picked out of them with one index_select, instead of three gathers per term.
+    Torques are left out when INCLUDE_TORQUE is off (read when the buffers are first allocated).
+    With COMPILE_GATHER on, both steps run as one compiled kernel.
+    The returned tensors are overwritten two calls later.
+
+    Args:
+        env: The RL environment
+
+    Returns:
+        tuple[torch.Tensor, torch.Tensor]: Views of one [batch, 129] tensor:
+            - [batch, 87] body joint positions, velocities and torques (29 each)
+            - [batch, 42] hand joint positions, velocities and torques (14 each)
+    """
+    cache = get_env_cache(env)
+    robot_data = cache["robot"].data
+
+    joint_pos = robot_data.joint_pos
+    joint_vel = robot_data.joint_vel
+
+    # Scratch and output tensors are allocated once per environment and reused across steps.
+    # The observation manager hands the term views out as is, so the output alternates between two
+    # buffers: the observations of the previous step stay intact until the one after is computed.
+    buffers = cache.get("joint_state_buffers")
+    if buffers is None:
+        batch, num_joints = joint_pos.shape
+        num_blocks = 3 if INCLUDE_TORQUE else 2
+        # Column of each output value in the [positions, velocities(, torques)] concatenation of all joints
+        columns = [
+            block * num_joints + joint
+            for indices in (BODY_JOINT_INDICES, HAND_JOINT_INDICES)
+            for block in range(num_blocks)
+            for joint in indices
+        ]
+        idx_t = torch.as_tensor(columns, dtype=torch.int32, device=joint_pos.device)
+        # With bfloat16 outputs the cast happens as part of the concatenation
+        dtype = torch.bfloat16 if USE_BF16_OBS else joint_pos.dtype
+        scratch = torch.empty((batch, num_blocks * num_joints), dtype=dtype, device=joint_pos.device)
+        outputs = [torch.empty((batch, len(columns)), dtype=dtype, device=joint_pos.device) for _ in range(2)]
+        num_body_states = num_blocks * len(BODY_JOINT_INDICES)
+        buffers = cache["joint_state_buffers"] = [idx_t, scratch, outputs, num_body_states, 0]
+    idx_t, scratch, outputs, num_body_states, current = buffers
+    buffers[-1] = current ^ 1
+
+    if INCLUDE_TORQUE:
+        sources = (joint_pos, joint_vel, robot_data.applied_torque)
+    else:
+        sources = (joint_pos, joint_vel)
+    # Two kernels per step, one when compiled. Not worth a CUDA graph (mode="reduce-overhead"): the
+    # articulation data tensors are not guaranteed to keep their storage between steps, so a graph
+    # would still need a copy into static inputs before each replay, and its outputs would live in
+    # graph-owned memory rather than in these buffers.
+    joint_states = outputs[current]
+    if COMPILE_GATHER:
+        _compiled_gather(joint_states, idx_t, *sources)
+    else:
+        torch.cat(sources, dim=1, out=scratch)
+        # Every environment row uses the same columns, so a 1-D index_select is enough: no per-row index
+        # tensor (gather with an expanded index) has to be built or read
+        torch.index_select(scratch, 1, idx_t, out=joint_states)
+    return joint_states[:, :num_body_states], joint_states[:, num_body_states:]
+
+
+def _gather(out: torch.Tensor, idx_t: torch.Tensor, *sources: torch.Tensor):
+    # Compiled, the concatenation is never materialized: each output column is read straight from
+    # its source tensor and written (cast to the output dtype) into the output buffer
+    out.copy_(torch.index_select(torch.cat(sources, dim=1), 1, idx_t))
+
+
+# Shapes are fixed for the life of an environment, and the guards are on shape and dtype only, so the
+# two alternating output buffers share one compiled graph
+_compiled_gather = torch.compile(_gather, fullgraph=True, dynamic=False)
+
+
+def pop_hand_joint_states(env: ManagerBasedRLEnv) -> torch.Tensor | None:
+    """Take the hand block left behind by a body term call of the current step, if any."""
+    pending = get_env_cache(env).pop("pending_hand_joint_states", None)
+    if pending is None:
+        return None
+    step, hand_states = pending
+    # A block from an earlier step is stale (hand term listed before the body term)
+    return hand_states if step == env.common_step_counter else None
+
+
+def stash_hand_joint_states(env: ManagerBasedRLEnv, hand_states: torch.Tensor):
+    """Leave the hand block of a fused gather for the hand term computed next."""
+    get_env_cache(env)["pending_hand_joint_states"] = (env.common_step_counter, hand_states)
@@ -12,9 +12,14 @@ from isaaclab.scene import InteractiveSceneCfg
 from isaaclab.sim.spawners.from_files.from_files_cfg import UsdFileCfg
 from isaaclab.utils import configclass
 
+from ..config.assets import prefer_instanceable
+
 # Get the project root directory
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+# Warehouse and both packing tables baked into one USD by scripts/merge_scene_assets.py
+ENVIRONMENT_USD_PATH = f"{PROJECT_ROOT}/assets/objects/warehouse_plus_tables.usd"
+
 
 @configclass
 class CylinderSceneCfg(InteractiveSceneCfg):
@@ -31,7 +36,7 @@ class CylinderSceneCfg(InteractiveSceneCfg):
             rot=[1.0, 0.0, 0.0, 0.0]
         ),
         spawn=UsdFileCfg(
-            usd_path=f"{PROJECT_ROOT}/assets/objects/small_warehouse/small_warehouse_digital_twin.usd",
+            usd_path=prefer_instanceable(f"{PROJECT_ROOT}/assets/objects/small_warehouse/small_warehouse_digital_twin.usd"),
         ),
     )
 
@@ -43,7 +48,7 @@ class CylinderSceneCfg(InteractiveSceneCfg):
             rot=[0.70091, 0.0, 0.0, 0.71325]
         ),
         spawn=UsdFileCfg(
-            usd_path=f"{PROJECT_ROOT}/assets/objects/PackingTable_2/PackingTable.usd",
+            usd_path=prefer_instanceable(f"{PROJECT_ROOT}/assets/objects/PackingTable_2/PackingTable.usd"),
             rigid_props=sim_utils.RigidBodyPropertiesCfg(kinematic_enabled=True),
         ),
     )
@@ -56,11 +61,14 @@ class CylinderSceneCfg(InteractiveSceneCfg):
             rot=[1.0, 0.0, 0.0, 0.0]
         ),
         spawn=UsdFileCfg(
-            usd_path=f"{PROJECT_ROOT}/assets/objects/PackingTable/PackingTable.usd",
+            usd_path=prefer_instanceable(f"{PROJECT_ROOT}/assets/objects/PackingTable/PackingTable.usd"),
             rigid_props=sim_utils.RigidBodyPropertiesCfg(kinematic_enabled=True),
         ),
     )
 
+    # Warehouse and tables merged into one asset (set in __post_init__ when the merged USD exists)
+    environment: AssetBaseCfg | None = None
+
     # Cylinder object for manipulation
     object = RigidObjectCfg(
         prim_path="/World/envs/env_.*/Object",
@@ -109,3 +117,15 @@ class CylinderSceneCfg(InteractiveSceneCfg):
         ),
     )
 
+    def __post_init__(self):
+        """Reference the merged environment USD, when generated, instead of the warehouse and tables."""
+        if os.path.isfile(ENVIRONMENT_USD_PATH):
+            # One reference to resolve and load instead of three; the tables keep their offsets inside it
+            self.environment = AssetBaseCfg(
+                prim_path="/World/envs/env_.*/Environment",
+                spawn=UsdFileCfg(usd_path=ENVIRONMENT_USD_PATH),
+            )
+            self.room_walls = None
+            self.packing_table1 = None
+            self.packing_table2 = None
+
@@ -6,7 +6,6 @@
 """Environment configuration for G1 cylinder manipulation task."""
 
 import torch
-import isaaclab.sim as sim_utils
 import isaaclab.envs.mdp as base_mdp
 from isaaclab.assets import ArticulationCfg
 from isaaclab.envs import ManagerBasedRLEnvCfg
@@ -19,7 +18,16 @@ from isaaclab.managers import TerminationTermCfg as DoneTerm
 from isaaclab.sensors import ContactSensorCfg
 from isaaclab.utils import configclass
 
-from g1_gr00t.config import G1_DEX3_43DOF_CFG, CameraPresets
+from g1_gr00t.config import (
+    EXPANDED_ARM_HAND_JOINT_NAMES,
+    G1_FRONT_CAMERA_CFG,
+    G1_WORLD_CAMERA_CFG,
+    LEFT_DEX3_WRIST_CAMERA_CFG,
+    RIGHT_DEX3_WRIST_CAMERA_CFG,
+    SKIP_CAMERA_OBS,
+    build_dex3_43dof,
+    common_sim_settings,
+)
 from g1_gr00t.scene import CylinderSceneCfg
 from . import mdp
 
@@ -31,61 +39,17 @@ class MoveCylinderSceneCfg(CylinderSceneCfg):
     # G1 robot with 43 DOF (Dex3 hands)
     # Robot positioned ~0.4m from cylinder (half arm's length)
     # Cylinder is at [-2.58514, -2.78975, 0.84], robot at [-3.0, -2.81811, 0.8]
-    robot: ArticulationCfg = G1_DEX3_43DOF_CFG.replace(
-        prim_path="/World/envs/env_.*/Robot",
-        init_state=ArticulationCfg.InitialStateCfg(
-            pos=(-3.0, -2.81811, 0.8),
-            rot=(1, 0, 0, 0),
-            joint_pos={
-                # Leg joints - standing pose (locked)
-                ".*_hip_pitch_joint": -0.20,
-                ".*_knee_joint": 0.42,
-                ".*_ankle_pitch_joint": -0.23,
-                
-                # Arm joints - reaching pose
-                ".*_elbow_joint": 0.87,
-                "left_shoulder_roll_joint": 0.18,
-                "left_shoulder_pitch_joint": 0.35,
-                "right_shoulder_roll_joint": -0.18,
-                "right_shoulder_pitch_joint": 0.35,
-                
-                # Hand joints (Dex3) - neutral/open pose
-                "left_hand_index_0_joint": 0.0,
-                "left_hand_middle_0_joint": 0.0,
-                "left_hand_thumb_0_joint": 0.0,
-                "left_hand_index_1_joint": 0.0,
-                "left_hand_middle_1_joint": 0.0,
-                "left_hand_thumb_1_joint": 0.0,
-                "left_hand_thumb_2_joint": 0.0,
-                
-                "right_hand_index_0_joint": 0.0,
-                "right_hand_middle_0_joint": 0.0,
-                "right_hand_thumb_0_joint": 0.0,
-                "right_hand_index_1_joint": 0.0,
-                "right_hand_middle_1_joint": 0.0,
-                "right_hand_thumb_1_joint": 0.0,
-                "right_hand_thumb_2_joint": 0.0,
-            },
-            joint_vel={".*": 0.0},
-        ),
-        # Lock the base and legs by making them kinematic
-        spawn=G1_DEX3_43DOF_CFG.spawn.replace(
-            rigid_props=sim_utils.RigidBodyPropertiesCfg(
-                disable_gravity=False,
-                retain_accelerations=False,
-                linear_damping=0.0,
-                angular_damping=0.0,
-                max_linear_velocity=1000.0,
-                max_angular_velocity=1000.0,
-                max_depenetration_velocity=1.0,
-            ),
-            articulation_props=sim_utils.ArticulationRootPropertiesCfg(
-                enabled_self_collisions=False,
-                solver_position_iteration_count=4,
-                solver_velocity_iteration_count=1,
-                fix_root_link=True,  # Lock the base in place
-            ),
-        ),
+    robot: ArticulationCfg = build_dex3_43dof(
+        init_pos=(-3.0, -2.81811, 0.8),
+        init_rot=(1, 0, 0, 0),
+        extra_joint_pos={
+            # Arm joints - reaching pose
+            ".*_elbow_joint": 0.87,
+            "left_shoulder_roll_joint": 0.18,
+            "left_shoulder_pitch_joint": 0.35,
+            "right_shoulder_roll_joint": -0.18,
+            "right_shoulder_pitch_joint": 0.35,
+        },
     )
     
     # Contact sensors
@@ -97,10 +61,10 @@ class MoveCylinderSceneCfg(CylinderSceneCfg):
     )
     
     # Cameras
-    front_camera = CameraPresets.g1_front_camera()
-    left_wrist_camera = CameraPresets.left_dex3_wrist_camera()
-    right_wrist_camera = CameraPresets.right_dex3_wrist_camera()
-    robot_camera = CameraPresets.g1_world_camera()
+    front_camera = G1_FRONT_CAMERA_CFG
+    left_wrist_camera = LEFT_DEX3_WRIST_CAMERA_CFG
+    right_wrist_camera = RIGHT_DEX3_WRIST_CAMERA_CFG
+    robot_camera = G1_WORLD_CAMERA_CFG
 
 
 @configclass
@@ -116,24 +80,7 @@ class ActionsCfg:
     
     joint_pos = base_mdp.JointPositionActionCfg(
         asset_name="robot",
-        joint_names=[
-            # Arms (14 DOF)
-            ".*_shoulder_pitch_joint",
-            ".*_shoulder_roll_joint",
-            ".*_shoulder_yaw_joint",
-            ".*_elbow_joint",
-            ".*_wrist_yaw_joint",
-            ".*_wrist_roll_joint",
-            ".*_wrist_pitch_joint",
-            # Hands (14 DOF - Dex3)
-            ".*_hand_index_0_joint",
-            ".*_hand_middle_0_joint",
-            ".*_hand_thumb_0_joint",
-            ".*_hand_index_1_joint",
-            ".*_hand_middle_1_joint",
-            ".*_hand_thumb_1_joint",
-            ".*_hand_thumb_2_joint",
-        ],
+        joint_names=list(EXPANDED_ARM_HAND_JOINT_NAMES),
         scale=1.0,
         use_default_offset=False,  # GR00T outputs absolute positions, not offsets!
     )
@@ -226,18 +173,13 @@ class MoveCylinderEnvCfg(ManagerBasedRLEnvCfg):
         self.decimation = 4
         self.episode_length_s = 20.0
         
-        # Simulation settings
-        self.sim.dt = 0.005
+        # Simulation, PhysX and physics material settings
+        common_sim_settings(self)
         self.scene.contact_forces.update_period = self.sim.dt
-        self.sim.render_interval = self.decimation
-        self.sim.physx.bounce_threshold_velocity = 0.01
-        self.sim.physx.gpu_found_lost_aggregate_pairs_capacity = 1024 * 1024 * 4
-        self.sim.physx.gpu_total_aggregate_pairs_capacity = 16 * 1024
-        self.sim.physx.friction_correlation_distance = 0.00625
         
-        # Physics material properties
-        self.sim.physics_material.static_friction = 1.0
-        self.sim.physics_material.dynamic_friction = 1.0
-        self.sim.physics_material.friction_combine_mode = "max"
-        self.sim.physics_material.restitution_combine_mode = "max"
-
+        # Cameras skipped: don't spawn the sensors at all
+        if SKIP_CAMERA_OBS:
+            self.scene.front_camera = None
+            self.scene.left_wrist_camera = None
+            self.scene.right_wrist_camera = None
+            self.scene.robot_camera = None
@@ -10,6 +10,8 @@ from __future__ import annotations
 import torch
 from typing import TYPE_CHECKING
 
+from g1_gr00t.observations.env_cache import get_env_cache
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
@@ -26,7 +28,12 @@ def compute_reward(env: ManagerBasedRLEnv) -> torch.Tensor:
         torch.Tensor: Reward value for each environment [batch]
     """
     # Return zero rewards (placeholder)
-    return torch.zeros(env.num_envs, device=env.device)
+    # The same zeros are returned every step: the reward manager scales them into a new tensor
+    cache = get_env_cache(env)
+    rewards = cache.get("reward_placeholder")
+    if rewards is None:
+        rewards = cache["reward_placeholder"] = torch.zeros(env.num_envs, device=env.device)
+    return rewards
 
 
 __all__ = ["compute_reward"]